@@ -1,16 +1,28 @@
 #!/usr/bin/env python3
 """Generate test video fixtures for DeepBrief development and testing."""
 
+import argparse
+import asyncio
+import atexit
+import hashlib
+import os
+import shutil
 import subprocess
 import sys
+import tempfile
+from collections.abc import Awaitable
+from functools import cache
 from pathlib import Path
-from typing import NamedTuple
+from typing import Any, NamedTuple, TypeVar
 
 import rich.progress as progress
 from rich.console import Console
+from rich.markup import escape
 
 console = Console()
 
+T = TypeVar("T")
+
 
 class VideoSpec(NamedTuple):
     """Specification for generating a test video."""
@@ -23,7 +35,51 @@ class VideoSpec(NamedTuple):
     audio_freq: int | None  # Hz, None for no audio
     text_overlay: str | None
     description: str
+    is_dev_sample: bool = False  # written to samples/ instead of tests/fixtures/
+
+
+# Bounds for the per-ffmpeg thread override
+MIN_FFMPEG_THREADS = 1
+MAX_FFMPEG_THREADS = 64
+
+# Shared ffmpeg prefix: overwrite outputs and keep stderr down to real errors
+_FFMPEG_COMMON = ("ffmpeg", "-y", "-hide_banner", "-nostats", "-loglevel", "error")
+
+# Codec overrides for the non-MP4 container variants
+_FORMAT_CODECS = {
+    "webm": ("-c:v", "libvpx-vp9", "-c:a", "libvorbis"),
+    "avi": ("-c:v", "libx264", "-c:a", "mp3"),
+}
+
+# lavfi source and overlay filter patterns, filled in with str.format
+_TESTSRC_TPL = "testsrc2=duration={duration}:size={width}x{height}:rate={fps}"
+_SINE_TPL = "sine=frequency={frequency}:duration={duration}"
+_DRAWTEXT_TPL = (
+    "drawtext=textfile={textfile}:fontcolor=white:fontsize={fontsize}"
+    ":box=1:boxcolor=black@{box_opacity}:boxborderw=5"
+    ":x=(w-text_w)/2:y=(h-text_h)/2"
+)
+
+# Realistic samples are 720p slides at 2 fps
+_REALISTIC_SIZE = {"width": 1280, "height": 720, "fps": 2}
+
+# Hardware H.264 encoders in order of preference, with their rate-control
+# options. Only videos above HW_ENCODE_MIN_PIXELS use them; the small fixtures
+# are dominated by startup cost and stay on libx264.
+_HW_H264_ENCODERS = {
+    "h264_nvenc": ("-c:v", "h264_nvenc", "-preset", "p4", "-cq", "28"),
+    "h264_vaapi": ("-c:v", "h264_vaapi", "-b:v", "2M"),
+    "h264_videotoolbox": ("-c:v", "h264_videotoolbox", "-b:v", "2M"),
+}
+_LIBX264_ARGS = ("-c:v", "libx264", "-preset", "fast", "-crf", "28")
+HW_ENCODE_MIN_PIXELS = 500_000
 
+# VAAPI needs an explicit render device and frames uploaded to the GPU
+_VAAPI_DEVICE = "/dev/dri/renderD128"
+_VAAPI_UPLOAD = "format=nv12,hwupload"
+
+# cgroup v2 CPU quota of the current container, if any
+_CGROUP_CPU_MAX = Path("/sys/fs/cgroup/cpu.max")
 
 # Test video specifications
 TEST_VIDEOS = [
@@ -78,6 +134,7 @@ TEST_VIDEOS = [
         audio_freq=1000,
         text_overlay="Good Presentation Sample",
         description="Development sample - good presentation style",
+        is_dev_sample=True,
     ),
     VideoSpec(
         name="dev_sample_needs_work",
@@ -88,17 +145,36 @@ TEST_VIDEOS = [
         audio_freq=1200,
         text_overlay="Needs Improvement Sample",
         description="Development sample - presentation needing improvement",
+        is_dev_sample=True,
     ),
 ]
 
 
+@cache
 def check_ffmpeg() -> bool:
-    """Check if ffmpeg is available."""
+    """Check if ffmpeg is available (probed once per run)."""
+    cmd = ["ffmpeg", "-version"]
     try:
+        if hasattr(os, "posix_spawnp"):
+            # subprocess only uses posix_spawn with close_fds=False and an
+            # absolute executable path, so spawn directly; this skips fork's
+            # copy of the parent's page tables (rich is already imported)
+            pid = os.posix_spawnp(
+                cmd[0],
+                cmd,
+                os.environ,
+                file_actions=[
+                    (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+                    (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+                ],
+            )
+            _, status = os.waitpid(pid, 0)
+            return os.waitstatus_to_exitcode(status) == 0
+
         result = subprocess.run(
-            ["ffmpeg", "-version"],
-            capture_output=True,
-            text=True,
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=False,
         )
         return result.returncode == 0
@@ -106,13 +182,14 @@ def check_ffmpeg() -> bool:
         return False
 
 
+@cache
 def check_espeak() -> bool:
-    """Check if espeak is available for text-to-speech."""
+    """Check if espeak is available for text-to-speech (probed once per run)."""
     try:
         result = subprocess.run(
             ["espeak", "--version"],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=False,
         )
         return result.returncode == 0
@@ -120,46 +197,362 @@ def check_espeak() -> bool:
         return False
 
 
-def create_speech_audio(
-    text: str, output_path: Path, duration: int | None = None
-) -> bool:
+def _cpu_budget() -> int:
+    """
+    Count the CPUs this process may actually use.
+
+    ``os.cpu_count()`` reports every core on the host, which oversubscribes
+    CI runners and containers limited by affinity masks, Slurm allocations
+    or cgroup v2 CPU quotas. Take the smallest of those limits.
+
+    Returns:
+        Usable CPU count (at least 1)
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS/Windows
+        cpus = os.cpu_count() or 1
+
+    slurm_cpus = os.environ.get("SLURM_CPUS_ON_NODE", "")
+    if slurm_cpus.isdigit() and int(slurm_cpus) > 0:
+        cpus = min(cpus, int(slurm_cpus))
+
+    # cgroup v2: "<quota> <period>", or "max <period>" when unlimited
+    try:
+        quota, period = _CGROUP_CPU_MAX.read_text().split()[:2]
+        if quota != "max":
+            cpus = min(cpus, -(-int(quota) // int(period)))
+    except (OSError, ValueError, ZeroDivisionError):
+        pass
+
+    return max(1, cpus)
+
+
+def _ffmpeg_threads_per_invocation(n_workers: int) -> int:
     """
-    Create speech audio from text using espeak if available.
+    Split the CPU budget between concurrently running ffmpeg processes.
+
+    libx264/libvpx default to roughly one thread per core each, so running
+    several encodes at once without a cap oversubscribes the machine.
 
     Args:
-        text: Text to convert to speech
-        output_path: Output audio file path
-        duration: Target duration in seconds (optional, not used with espeak)
+        n_workers: Number of ffmpeg processes expected to run at once
+
+    Returns:
+        Thread count to pass to each ffmpeg invocation (at least 1)
+    """
+    return max(1, _cpu_budget() // n_workers)
+
+
+def _ffmpeg_threads_arg(value: str) -> int:
+    """Validate a --ffmpeg-threads / DEEPBRIEF_FFMPEG_THREADS value."""
+    try:
+        threads = int(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"invalid thread count: {value!r}") from e
+    if not MIN_FFMPEG_THREADS <= threads <= MAX_FFMPEG_THREADS:
+        raise argparse.ArgumentTypeError(
+            f"thread count must be between {MIN_FFMPEG_THREADS} and "
+            f"{MAX_FFMPEG_THREADS}, got {threads}"
+        )
+    return threads
+
+
+@cache
+def _overlay_dir() -> Path:
+    """Scratch directory for overlay text files, removed at exit."""
+    path = tempfile.mkdtemp(prefix="deepbrief-overlays-")
+    atexit.register(shutil.rmtree, path, ignore_errors=True)
+    return Path(path)
+
+
+@cache
+def _overlay_textfile(text: str) -> str:
+    """
+    Write overlay text to a file and return it as a quoted filter argument.
+
+    drawtext reads ``textfile`` verbatim, so labels may contain quotes,
+    colons, commas or newlines without any filter-graph escaping. Each
+    distinct label is written once per run.
+
+    Args:
+        text: Overlay text
 
     Returns:
-        True if successful, False otherwise
+        Single-quoted path suitable for ``drawtext=textfile=...``
+    """
+    digest = hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+    path = _overlay_dir() / f"{digest}.txt"
+    path.write_text(text, encoding="utf-8")
+    # Forward slashes avoid backslash escapes; a Windows drive colon still
+    # has to be escaped for the option parser
+    return "'" + path.as_posix().replace(":", "\\:") + "'"
+
+
+def _drawtext_filter(text: str, fontsize: int = 24, box_opacity: float = 0.5) -> str:
+    """Build the centred caption filter used for video overlays."""
+    return _DRAWTEXT_TPL.format(
+        textfile=_overlay_textfile(text), fontsize=fontsize, box_opacity=box_opacity
+    )
+
+
+def _hw_input_args(encoder: str) -> tuple[str, ...]:
+    """Global options an encoder needs ahead of the inputs."""
+    return ("-vaapi_device", _VAAPI_DEVICE) if encoder == "h264_vaapi" else ()
+
+
+def _hw_upload_filter(encoder: str) -> str:
+    """Filter that moves frames to the GPU for the encoder, if it needs one."""
+    return _VAAPI_UPLOAD if encoder == "h264_vaapi" else ""
+
+
+def _hw_encoder_works(encoder: str) -> bool:
+    """
+    Check that a hardware encoder can actually open a device.
+
+    ``ffmpeg -encoders`` lists what was compiled in, not what the machine
+    has, so a build with NVENC support still fails without an NVIDIA GPU.
     """
-    # Note: duration parameter is not used with espeak but kept for API compatibility
-    _ = duration  # Mark as intentionally unused
-    if not check_espeak():
+    upload = _hw_upload_filter(encoder)
+    cmd = [
+        *_FFMPEG_COMMON,
+        *_hw_input_args(encoder),
+        *("-f", "lavfi", "-i", "testsrc2=duration=0.1:size=256x256:rate=10"),
+        *(("-vf", upload) if upload else ()),
+        *_HW_H264_ENCODERS[encoder],
+        *("-f", "null", "-"),
+    ]
+    try:
+        result = subprocess.run(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False
+        )
+        return result.returncode == 0
+    except FileNotFoundError:
         return False
 
+
+@cache
+def ffmpeg_capabilities() -> frozenset[str]:
+    """
+    List the encoders compiled into ffmpeg (probed once per run).
+
+    Returns:
+        Encoder names, e.g. ``libx264`` or ``h264_nvenc``
+    """
     try:
-        # Create speech with espeak
-        cmd = [
-            "espeak",
-            "-s",
-            "150",  # words per minute
-            "-v",
-            "en",  # voice
-            "-w",
-            str(output_path),  # write to file
-            text,
-        ]
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except FileNotFoundError:
+        return frozenset()
+
+    # A legend precedes a " ------" separator; encoder lines follow it and
+    # look like " V....D h264_nvenc  NVIDIA NVENC H.264 encoder"
+    _, _, listing = result.stdout.partition(" ------")
+    return frozenset(
+        fields[1] for line in listing.splitlines() if len(fields := line.split()) >= 2
+    )
+
+
+def preferred_h264_encoder(capabilities: frozenset[str]) -> str:
+    """
+    Pick the best working H.264 encoder.
+
+    Called once from main(); the result is passed down to every command
+    builder so neither probe is repeated per video.
+
+    Args:
+        capabilities: Encoder names from ffmpeg_capabilities()
 
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        return result.returncode == 0 and output_path.exists()
+    Returns:
+        Name of a usable hardware encoder, or ``libx264``
+    """
+    for encoder in _HW_H264_ENCODERS:
+        if encoder in capabilities and _hw_encoder_works(encoder):
+            return encoder
+    return "libx264"
+
+
+def _build_cmd(
+    spec: VideoSpec,
+    output_file: Path,
+    format_ext: str,
+    threads: int,
+    hw_encoder: str = "libx264",
+) -> list[str]:
+    """
+    Build the ffmpeg command for a single test video.
+
+    Args:
+        spec: Video specification
+        output_file: Output file path
+        format_ext: Output format extension
+        threads: Encoder thread cap (0 lets ffmpeg decide)
+        hw_encoder: H.264 encoder to use for large MP4 outputs
+
+    Returns:
+        Complete ffmpeg argument list
+    """
+    # Video input: colored bars with optional text overlay
+    video_filter = _TESTSRC_TPL.format_map(spec._asdict())
+    if spec.text_overlay:
+        video_filter += f",{_drawtext_filter(spec.text_overlay)}"
 
-    except Exception:
+    if spec.audio_freq:
+        audio_args = (
+            "-f",
+            "lavfi",
+            "-i",
+            _SINE_TPL.format(frequency=spec.audio_freq, duration=spec.duration),
+            "-c:a",
+            "aac",
+            "-b:a",
+            "32k",
+        )
+    else:
+        audio_args = ("-an",)  # No audio
+
+    encoder = _video_encoder(spec, format_ext, hw_encoder)
+    upload = _hw_upload_filter(encoder)
+
+    return [
+        *_FFMPEG_COMMON,
+        *_hw_input_args(encoder),
+        *("-f", "lavfi", "-i", video_filter),
+        *audio_args,
+        *(("-vf", upload) if upload else ()),
+        *_HW_H264_ENCODERS.get(encoder, _LIBX264_ARGS),
+        *_FORMAT_CODECS.get(format_ext, ()),
+        # Output option, so it caps the encoder rather than the lavfi inputs
+        *("-threads", str(threads)),
+        str(output_file),
+    ]
+
+
+def _video_encoder(spec: VideoSpec, format_ext: str, hw_encoder: str) -> str:
+    """Pick the H.264 encoder for a spec; only large MP4s go to hardware."""
+    if format_ext == "mp4" and spec.width * spec.height > HW_ENCODE_MIN_PIXELS:
+        return hw_encoder
+    return "libx264"
+
+
+def _spec_digest(*parts: object) -> str:
+    """Hash everything that determines an output's content."""
+    return hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+
+
+def _digest_file(output_file: Path) -> Path:
+    """Sidecar file recording the digest an output was generated from."""
+    return output_file.with_name(f"{output_file.name}.sha")
+
+
+def _is_up_to_date(output_file: Path, digest: str) -> bool:
+    """Check whether an output exists and was generated from ``digest``."""
+    try:
+        return output_file.exists() and _digest_file(output_file).read_text() == digest
+    except OSError:
         return False
 
 
-def generate_video(spec: VideoSpec, output_path: Path, format_ext: str = "mp4") -> bool:
+def _invalidate_digest(output_file: Path) -> None:
+    """Drop a sidecar before regenerating, so a failed encode is never skipped."""
+    _digest_file(output_file).unlink(missing_ok=True)
+
+
+async def _report_output(
+    output_file: Path, details: str = "", digest: str | None = None
+) -> bool:
+    """
+    Report a generated file, treating a missing output as a failure.
+
+    Args:
+        output_file: File ffmpeg was asked to write
+        details: Extra markup appended to the success line
+        digest: Spec digest to record next to the output on success
+
+    Returns:
+        True if the file exists, False otherwise
+    """
+    # A single stat() both confirms the file exists and gives its size; run it
+    # in a worker thread so slow storage never stalls other encodes' I/O
+    try:
+        file_size = (await asyncio.to_thread(output_file.stat)).st_size
+    except FileNotFoundError:
+        console.print(f"[red]✗[/red] ffmpeg did not produce {output_file.name}")
+        return False
+
+    if digest is not None:
+        await asyncio.to_thread(_digest_file(output_file).write_text, digest)
+
+    console.print(
+        f"[green]✓[/green] Generated {output_file.name} ({file_size:,} bytes){details}"
+    )
+    return True
+
+
+async def _run_process(
+    cmd: list[str], pass_fds: tuple[int, ...] = ()
+) -> tuple[int, str]:
+    """
+    Run a command without blocking the event loop.
+
+    Args:
+        cmd: Command and arguments
+        pass_fds: File descriptors the child process should inherit
+
+    Returns:
+        Tuple of (return code, decoded stderr)
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+        pass_fds=pass_fds,
+    )
+    _, stderr = await proc.communicate()
+    assert proc.returncode is not None
+    return proc.returncode, stderr.decode("utf-8", errors="replace")
+
+
+async def create_speech_audio(text: str, stdout: int) -> asyncio.subprocess.Process:
+    """
+    Start espeak synthesizing text as a WAV stream.
+
+    The audio is written straight into ``stdout`` (typically the write end of
+    a pipe feeding ffmpeg), so no intermediate WAV file touches the disk.
+
+    Args:
+        text: Text to convert to speech
+        stdout: File descriptor that receives the WAV stream
+
+    Returns:
+        The running espeak process
+    """
+    cmd = [
+        "espeak",
+        "-s",
+        "150",  # words per minute
+        "-v",
+        "en",  # voice
+        "--stdout",  # stream WAV instead of writing a file
+        text,
+    ]
+    return await asyncio.create_subprocess_exec(
+        *cmd, stdout=stdout, stderr=asyncio.subprocess.DEVNULL
+    )
+
+
+async def generate_video(
+    spec: VideoSpec,
+    output_path: Path,
+    format_ext: str = "mp4",
+    threads: int = 0,
+    hw_encoder: str = "libx264",
+    force: bool = False,
+) -> bool:
     """
     Generate a test video based on specification.
 
@@ -167,62 +560,259 @@ def generate_video(spec: VideoSpec, output_path: Path, format_ext: str = "mp4")
         spec: Video specification
         output_path: Output file path
         format_ext: Output format extension
+        threads: Encoder thread cap (0 lets ffmpeg decide)
+        hw_encoder: H.264 encoder to use for large MP4 outputs
+        force: Regenerate even if the output is up to date
 
     Returns:
-        True if successful, False otherwise
+        True if successful (or already up to date), False otherwise
     """
     output_file = output_path / f"{spec.name}.{format_ext}"
+    digest = _spec_digest(
+        spec, format_ext, _video_encoder(spec, format_ext, hw_encoder)
+    )
+    if not force and _is_up_to_date(output_file, digest):
+        console.print(f"[dim]• {output_file.name} is up to date[/dim]")
+        return True
 
-    # Build ffmpeg command
-    cmd = ["ffmpeg", "-y"]  # -y to overwrite existing files
+    _invalidate_digest(output_file)
+    cmd = _build_cmd(spec, output_file, format_ext, threads, hw_encoder)
+
+    try:
+        returncode, stderr = await _run_process(cmd)
+        if returncode != 0:
+            console.print(
+                f"[red]Error generating {output_file}:[/red]\n{escape(stderr)}"
+            )
+            return False
 
-    # Video input: colored bars with text overlay
-    video_filter = f"testsrc2=duration={spec.duration}:size={spec.width}x{spec.height}:rate={spec.fps}"
+        return await _report_output(output_file, digest=digest)
 
-    if spec.text_overlay:
-        # Add text overlay
-        video_filter += f",drawtext=text='{spec.text_overlay}':fontcolor=white:fontsize=24:box=1:boxcolor=black@0.5:boxborderw=5:x=(w-text_w)/2:y=(h-text_h)/2"
+    except Exception as e:
+        console.print(f"[red]Error generating {output_file}: {e}[/red]")
+        return False
 
-    cmd.extend(["-f", "lavfi", "-i", video_filter])
 
-    # Audio input (if specified)
-    if spec.audio_freq:
-        audio_input = f"sine=frequency={spec.audio_freq}:duration={spec.duration}"
-        cmd.extend(["-f", "lavfi", "-i", audio_input])
-        cmd.extend(["-c:a", "aac", "-b:a", "32k"])
+async def generate_video_batch(
+    specs: list[VideoSpec], output_path: Path, threads: int = 0, force: bool = False
+) -> int:
+    """
+    Generate several MP4 test videos with a single ffmpeg invocation.
+
+    The small fixtures are dominated by ffmpeg startup rather than encoding,
+    so they share one process: every spec gets its own lavfi inputs, a
+    labelled branch in one filter graph, and its own output file.
+
+    Args:
+        specs: Video specifications to render
+        output_path: Output directory
+        threads: Encoder thread cap per output (0 lets ffmpeg decide)
+        force: Regenerate even if the outputs are up to date
+
+    Returns:
+        Number of videos generated or already up to date (the regenerated ones
+        succeed or fail together, as they share one process)
+    """
+    # Small fixtures never use the hardware encoder
+    digests = {spec: _spec_digest(spec, "mp4", "libx264") for spec in specs}
+    if not force:
+        current = [
+            spec
+            for spec in specs
+            if _is_up_to_date(output_path / f"{spec.name}.mp4", digests[spec])
+        ]
+        for spec in current:
+            console.print(f"[dim]• {spec.name}.mp4 is up to date[/dim]")
+        specs = [spec for spec in specs if spec not in current]
+        up_to_date = len(current)
     else:
-        cmd.extend(["-an"])  # No audio
+        up_to_date = 0
+
+    if not specs:
+        return up_to_date
+
+    cmd = list(_FFMPEG_COMMON)
+    filters: list[str] = []
+    outputs: list[str] = []
+    output_files: list[Path] = []
+    input_index = 0
+
+    for n, spec in enumerate(specs):
+        output_file = output_path / f"{spec.name}.mp4"
+        output_files.append(output_file)
+        _invalidate_digest(output_file)
+
+        video_input = input_index
+        cmd.extend(
+            [
+                "-f",
+                "lavfi",
+                "-i",
+                _TESTSRC_TPL.format_map(spec._asdict()),
+            ]
+        )
+        input_index += 1
+
+        overlay = _drawtext_filter(spec.text_overlay) if spec.text_overlay else "null"
+        filters.append(f"[{video_input}:v]{overlay}[v{n}]")
+        outputs.extend(["-map", f"[v{n}]"])
 
-    # Video encoding
-    cmd.extend(["-c:v", "libx264", "-preset", "fast", "-crf", "28"])
+        if spec.audio_freq:
+            cmd.extend(
+                [
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    _SINE_TPL.format(frequency=spec.audio_freq, duration=spec.duration),
+                ]
+            )
+            outputs.extend(["-map", f"{input_index}:a", "-c:a", "aac", "-b:a", "32k"])
+            input_index += 1
 
-    # Format-specific options
-    if format_ext == "webm":
-        cmd.extend(["-c:v", "libvpx-vp9", "-c:a", "libvorbis"])
-    elif format_ext == "avi":
-        cmd.extend(["-c:v", "libx264", "-c:a", "mp3"])
+        outputs.extend(
+            ["-c:v", "libx264", "-preset", "fast", "-crf", "28"]
+            + ["-threads", str(threads), str(output_file)]
+        )
 
-    cmd.append(str(output_file))
+    cmd.extend(["-filter_complex", ";".join(filters), *outputs])
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        if result.returncode != 0:
-            console.print(f"[red]Error generating {output_file}:[/red]")
-            console.print(result.stderr)
-            return False
+        returncode, stderr = await _run_process(cmd)
+        if returncode != 0:
+            names = ", ".join(f.name for f in output_files)
+            console.print(f"[red]Error generating {names}:[/red]\n{escape(stderr)}")
+            return up_to_date
 
-        file_size = output_file.stat().st_size
-        console.print(
-            f"[green]✓[/green] Generated {output_file.name} ({file_size:,} bytes)"
+        reported = await asyncio.gather(
+            *(
+                _report_output(output_file, digest=digests[spec])
+                for spec, output_file in zip(specs, output_files, strict=True)
+            )
         )
-        return True
+        return up_to_date + sum(reported)
 
     except Exception as e:
-        console.print(f"[red]Error generating {output_file}: {e}[/red]")
-        return False
+        console.print(f"[red]Error generating batch in {output_path}: {e}[/red]")
+        return up_to_date
+
+
+def _realistic_cmd(
+    samples: list[dict[str, Any]],
+    audio_inputs: list[tuple[str, ...]],
+    output_path: Path,
+    threads: int,
+    encoder: str,
+) -> list[str]:
+    """
+    Build one ffmpeg command that renders every realistic 720p sample.
+
+    Each sample contributes a testsrc2 input and an audio input, a labelled
+    drawtext branch in a shared filter graph, and its own output block.
+
+    Args:
+        samples: Sample definitions (name, description, duration, script)
+        audio_inputs: ffmpeg input arguments for each sample's audio track
+        output_path: Output directory
+        threads: Encoder thread cap per output (0 lets ffmpeg decide)
+        encoder: H.264 encoder (every realistic sample is 720p)
+
+    Returns:
+        Complete ffmpeg argument list
+    """
+    upload = _hw_upload_filter(encoder)
+    if encoder == "libx264":
+        video_args = ("-c:v", "libx264", "-preset", "fast", "-crf", "23")
+    else:
+        video_args = _HW_H264_ENCODERS[encoder]
+
+    inputs: list[str] = list(_hw_input_args(encoder))
+    filters: list[str] = []
+    outputs: list[str] = []
+
+    for n, (sample, audio_input) in enumerate(zip(samples, audio_inputs, strict=True)):
+        video_index, audio_index = 2 * n, 2 * n + 1
+        inputs.extend(
+            [
+                *("-f", "lavfi", "-i"),
+                _TESTSRC_TPL.format(duration=sample["duration"], **_REALISTIC_SIZE),
+                *audio_input,
+            ]
+        )
+        filters.append(
+            f"[{video_index}:v]{_drawtext_filter(sample['name'], 36, 0.7)}"
+            f"{',' + upload if upload else ''}[v{n}]"
+        )
+        outputs.extend(
+            [
+                *("-map", f"[v{n}]", "-map", f"{audio_index}:a"),
+                *video_args,
+                *("-c:a", "aac", "-b:a", "64k"),
+                *("-t", str(sample["duration"]), "-threads", str(threads)),
+                str(output_path / f"{sample['name']}.mp4"),
+            ]
+        )
+
+    return [
+        *_FFMPEG_COMMON,
+        *inputs,
+        *("-filter_complex", ";".join(filters)),
+        *outputs,
+    ]
+
+
+async def _encode_with_speech(
+    samples: list[dict[str, Any]], output_path: Path, threads: int, encoder: str
+) -> tuple[int, str]:
+    """
+    Encode all realistic samples with espeak narration in one ffmpeg process.
+
+    Every script gets its own espeak process writing into a pipe; ffmpeg
+    inherits the read ends and opens them as ``pipe:<fd>`` inputs, so no WAV
+    file touches the disk.
 
+    Args:
+        samples: Sample definitions (name, description, duration, script)
+        output_path: Output directory
+        threads: Encoder thread cap per output (0 lets ffmpeg decide)
+        encoder: H.264 encoder to use
+
+    Returns:
+        Tuple of (ffmpeg return code, decoded stderr)
+    """
+    read_fds: list[int] = []
+    espeaks: list[asyncio.subprocess.Process] = []
+    try:
+        # One espeak per script, all started before ffmpeg so they synthesize
+        # concurrently. A single long-lived `espeak --stdin --stdout` cannot
+        # replace them: it emits one continuous WAV stream with a single RIFF
+        # header, so there is no boundary to split the scripts back apart on.
+        for sample in samples:
+            read_fd, write_fd = os.pipe()
+            read_fds.append(read_fd)
+            try:
+                espeaks.append(await create_speech_audio(sample["script"], write_fd))
+            finally:
+                # ffmpeg must see EOF once espeak exits
+                os.close(write_fd)
+
+        speech_inputs = [("-i", f"pipe:{fd}") for fd in read_fds]
+        cmd = _realistic_cmd(samples, speech_inputs, output_path, threads, encoder)
+        return await _run_process(cmd, pass_fds=tuple(read_fds))
+    finally:
+        for fd in read_fds:
+            os.close(fd)
+        # Reap espeak; ffmpeg's exit status already tells us whether the
+        # audio was usable
+        for espeak in espeaks:
+            await espeak.wait()
 
-def create_realistic_samples(output_path: Path) -> bool:
+
+async def create_realistic_samples(
+    output_path: Path,
+    threads: int = 0,
+    encoder: str = "libx264",
+    force: bool = False,
+) -> bool:
     """Create more realistic sample videos with speech-like audio patterns."""
 
     samples = [
@@ -246,119 +836,162 @@ def create_realistic_samples(output_path: Path) -> bool:
         },
     ]
 
-    success_count = 0
-
-    # Check if we can create speech audio
-    speech_available = check_espeak()
+    # Check if we can create speech audio. The narration is piped into ffmpeg
+    # through inherited descriptors, which needs POSIX fd passing.
+    speech_available = check_espeak() and os.name == "posix"
     if not speech_available:
         console.print(
             "[yellow]Warning: espeak not available. Videos will have tone audio instead of speech.[/yellow]"
         )
         console.print("Install espeak for realistic speech: sudo apt install espeak")
 
+    # Skip samples already rendered with the audio type we can produce now; a
+    # tone fallback is regenerated once espeak becomes available
+    def sample_digest(sample: dict[str, Any], speech: bool) -> str:
+        return _spec_digest(sample, encoder, "speech" if speech else "tone")
+
+    if not force:
+        current = [
+            sample
+            for sample in samples
+            if _is_up_to_date(
+                output_path / f"{sample['name']}.mp4",
+                sample_digest(sample, speech_available),
+            )
+        ]
+        for sample in current:
+            console.print(f"[dim]• {sample['name']}.mp4 is up to date[/dim]")
+        samples = [sample for sample in samples if sample not in current]
+        if not samples:
+            return True
+
     for sample in samples:
-        output_file = output_path / f"{sample['name']}.mp4"
-        audio_file = None
+        _invalidate_digest(output_path / f"{sample['name']}.mp4")
 
+    # All samples share a single ffmpeg process; fall back to tone audio for
+    # the whole batch if the speech pipeline fails
+    returncode, stderr = -1, ""
+    if speech_available:
         try:
-            if speech_available:
-                # Try to create speech audio
-                audio_file = output_path / f"{sample['name']}_speech.wav"
-                if create_speech_audio(
-                    sample["script"], audio_file, sample["duration"]
-                ):
-                    # Use speech audio
-                    cmd = [
-                        "ffmpeg",
-                        "-y",
-                        "-f",
-                        "lavfi",
-                        "-i",
-                        f"testsrc2=duration={sample['duration']}:size=1280x720:rate=2",
-                        "-i",
-                        str(audio_file),
-                        "-filter_complex",
-                        f"[0:v]drawtext=text='{sample['name']}':fontcolor=white:fontsize=36:box=1:boxcolor=black@0.7:boxborderw=5:x=(w-text_w)/2:y=(h-text_h)/2[v]",
-                        "-map",
-                        "[v]",
-                        "-map",
-                        "1:a",
-                        "-c:v",
-                        "libx264",
-                        "-preset",
-                        "fast",
-                        "-crf",
-                        "23",
-                        "-c:a",
-                        "aac",
-                        "-b:a",
-                        "64k",
-                        "-t",
-                        str(sample["duration"]),
-                        str(output_file),
-                    ]
-                else:
-                    speech_available = False  # Fall back to tone audio
-
-            if not speech_available:
-                # Fall back to tone audio
-                cmd = [
-                    "ffmpeg",
-                    "-y",
-                    "-f",
-                    "lavfi",
-                    "-i",
-                    f"testsrc2=duration={sample['duration']}:size=1280x720:rate=2",
-                    "-f",
-                    "lavfi",
-                    "-i",
-                    f"sine=frequency=440:duration={sample['duration']}",
-                    "-filter_complex",
-                    f"[0:v]drawtext=text='{sample['name']}':fontcolor=white:fontsize=36:box=1:boxcolor=black@0.7:boxborderw=5:x=(w-text_w)/2:y=(h-text_h)/2[v]",
-                    "-map",
-                    "[v]",
-                    "-map",
-                    "1:a",
-                    "-c:v",
-                    "libx264",
-                    "-preset",
-                    "fast",
-                    "-crf",
-                    "23",
-                    "-c:a",
-                    "aac",
-                    "-b:a",
-                    "64k",
-                    "-t",
-                    str(sample["duration"]),
-                    str(output_file),
-                ]
+            returncode, stderr = await _encode_with_speech(
+                samples, output_path, threads, encoder
+            )
+        except OSError as e:
+            stderr = str(e)
+        speech_available = returncode == 0
 
-            result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-            if result.returncode == 0:
-                file_size = output_file.stat().st_size
-                audio_type = "speech" if speech_available else "tone"
-                console.print(
-                    f"[green]✓[/green] Generated {sample['name']}.mp4 ({file_size:,} bytes) [{audio_type}]"
-                )
-                console.print(f"  [dim]{sample['description']}[/dim]")
-                success_count += 1
-            else:
-                console.print(f"[red]✗[/red] Failed to generate {sample['name']}.mp4")
-                console.print(f"  [dim]{result.stderr}[/dim]")
+    if not speech_available:
+        tone_inputs = [
+            (
+                *("-f", "lavfi", "-i"),
+                _SINE_TPL.format(frequency=440, duration=sample["duration"]),
+            )
+            for sample in samples
+        ]
+        cmd = _realistic_cmd(samples, tone_inputs, output_path, threads, encoder)
+        try:
+            returncode, stderr = await _run_process(cmd)
+        except OSError as e:
+            returncode, stderr = -1, str(e)
 
-        except Exception as e:
-            console.print(f"[red]✗[/red] Error generating {sample['name']}.mp4: {e}")
-        finally:
-            # Clean up temporary audio file
-            if audio_file and audio_file.exists():
-                audio_file.unlink()
+    if returncode != 0:
+        names = ", ".join(f"{sample['name']}.mp4" for sample in samples)
+        console.print(
+            f"[red]✗[/red] Failed to generate {names}\n  [dim]{escape(stderr)}[/dim]"
+        )
+        return False
 
-    return success_count == len(samples)
+    audio_type = escape("[speech]" if speech_available else "[tone]")
+    reported = await asyncio.gather(
+        *(
+            _report_output(
+                output_path / f"{sample['name']}.mp4",
+                f" {audio_type}\n  [dim]{sample['description']}[/dim]",
+                sample_digest(sample, speech_available),
+            )
+            for sample in samples
+        )
+    )
+    return all(reported)
 
 
-def main() -> int:
-    """Main function to generate all test videos."""
+def _jobs_arg(value: str) -> int:
+    """Validate a --jobs / DEEPBRIEF_JOBS value."""
+    try:
+        jobs = int(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"invalid job count: {value!r}") from e
+    if jobs < 1:
+        raise argparse.ArgumentTypeError(f"job count must be at least 1, got {jobs}")
+    return jobs
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=_jobs_arg,
+        default=None,
+        help=(
+            "Number of ffmpeg processes to run at once (default: half the "
+            "usable CPUs; env: DEEPBRIEF_JOBS)"
+        ),
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate every video even if it is up to date",
+    )
+    parser.add_argument(
+        "--ffmpeg-threads",
+        type=_ffmpeg_threads_arg,
+        default=None,
+        help=(
+            "Threads per ffmpeg process (default: CPU count divided by the "
+            "number of concurrent encodes; env: DEEPBRIEF_FFMPEG_THREADS)"
+        ),
+    )
+    args = parser.parse_args(argv)
+
+    # Environment overrides apply only when the flag was not given
+    env_overrides = [
+        ("jobs", "DEEPBRIEF_JOBS", _jobs_arg),
+        ("ffmpeg_threads", "DEEPBRIEF_FFMPEG_THREADS", _ffmpeg_threads_arg),
+    ]
+    for dest, env_var, validate in env_overrides:
+        env_value = os.environ.get(env_var)
+        if getattr(args, dest) is None and env_value:
+            try:
+                setattr(args, dest, validate(env_value))
+            except argparse.ArgumentTypeError as e:
+                parser.error(f"{env_var}: {e}")
+
+    return args
+
+
+def _concurrency(args: argparse.Namespace) -> tuple[int, int]:
+    """
+    Resolve how many ffmpeg processes to run at once and threads for each.
+
+    Explicit --jobs / --ffmpeg-threads values (or their environment
+    overrides) win; otherwise half the usable CPUs run encodes, and the CPU
+    budget is split evenly between them.
+
+    Args:
+        args: Parsed command-line options
+
+    Returns:
+        Tuple of (concurrent ffmpeg processes, threads per process)
+    """
+    max_workers = args.jobs or max(1, _cpu_budget() // 2)
+    threads = args.ffmpeg_threads or _ffmpeg_threads_per_invocation(max_workers)
+    return max_workers, threads
+
+
+async def amain(args: argparse.Namespace) -> int:
+    """Generate all test videos."""
     console.print("[bold blue]DeepBrief Test Video Generator[/bold blue]\n")
 
     # Check prerequisites
@@ -384,36 +1017,76 @@ def main() -> int:
     console.print(f"  Test fixtures: {fixtures_path}")
     console.print(f"  Development samples: {samples_path}\n")
 
-    total_videos = 0
-    successful_videos = 0
+    # Build the full job list up front; every job is an independent ffmpeg
+    # process, so they can all run concurrently on the event loop. The small
+    # MP4 fixtures share one process, while the larger dev samples and the
+    # alternative container formats (which swap codecs) each get their own.
+    fixture_batch: list[VideoSpec] = []
+    jobs: list[tuple[VideoSpec, Path, str]] = []
+    for spec in TEST_VIDEOS:
+        # Determine output path based on video purpose
+        if spec.is_dev_sample:
+            jobs.append((spec, samples_path, "mp4"))
+        else:
+            fixture_batch.append(spec)
 
-    # Generate basic test videos
-    console.print("[bold]Generating test fixture videos...[/bold]")
-    with progress.Progress() as prog:
-        task = prog.add_task("Generating videos...", total=len(TEST_VIDEOS))
+        # Generate additional formats for format testing
+        if spec.name == "different_format_test":
+            jobs.extend((spec, fixtures_path, fmt) for fmt in ["webm", "avi"])
 
-        for spec in TEST_VIDEOS:
-            total_videos += 1
+    total_videos = len(fixture_batch) + len(jobs)
+    max_workers, threads = _concurrency(args)
+    semaphore = asyncio.Semaphore(max_workers)
 
-            # Determine output path based on video purpose
-            output_path = samples_path if "dev_sample" in spec.name else fixtures_path
+    # Probe encoders once; every job reuses the result
+    hw_encoder = preferred_h264_encoder(ffmpeg_capabilities())
+    if hw_encoder != "libx264":
+        console.print(f"Using {hw_encoder} for large videos\n")
 
-            # Generate MP4 version
-            if generate_video(spec, output_path, "mp4"):
-                successful_videos += 1
+    # Generate basic test videos
+    console.print("[bold]Generating test fixture videos...[/bold]")
+    with progress.Progress(console=console) as prog:
+        task = prog.add_task("Generating videos...", total=total_videos)
+
+        async def bounded(job: Awaitable[T]) -> T:
+            async with semaphore:
+                return await job
 
-            # Generate additional formats for format testing
-            if spec.name == "different_format_test":
-                for fmt in ["webm", "avi"]:
-                    total_videos += 1
-                    if generate_video(spec, fixtures_path, fmt):
-                        successful_videos += 1
+        # Map each task to the number of videos it produces
+        n_videos = {
+            asyncio.create_task(
+                bounded(
+                    generate_video_batch(
+                        fixture_batch, fixtures_path, threads, args.force
+                    )
+                )
+            ): len(fixture_batch)
+        }
+        n_videos.update(
+            (
+                asyncio.create_task(
+                    bounded(
+                        generate_video(spec, path, fmt, threads, hw_encoder, args.force)
+                    )
+                ),
+                1,
+            )
+            for spec, path, fmt in jobs
+        )
 
-            prog.advance(task)
+        # Jobs that finish together are reported in a single progress update
+        successful_videos = 0
+        pending = set(n_videos)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            successful_videos += sum(int(finished.result()) for finished in done)
+            prog.advance(task, sum(n_videos[finished] for finished in done))
 
     # Generate realistic samples
     console.print("\n[bold]Generating realistic sample videos...[/bold]")
-    if create_realistic_samples(samples_path):
+    if await create_realistic_samples(samples_path, threads, hw_encoder, args.force):
         console.print("[green]✓[/green] All realistic samples generated successfully")
     else:
         console.print("[yellow]⚠[/yellow] Some realistic samples failed to generate")
@@ -432,5 +1105,10 @@ def main() -> int:
         return 1
 
 
+def main(argv: list[str] | None = None) -> int:
+    """Main function to generate all test videos."""
+    return asyncio.run(amain(parse_args(argv)))
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -8,21 +8,30 @@ and verifies the installation.
 
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+# Keeps each command's status lines together when checks run concurrently
+_print_lock = threading.Lock()
+
 
 def run_command(cmd: list[str], description: str) -> bool:
     """Run a command and return success status."""
-    print(f"🔄 {description}...")
+    with _print_lock:
+        print(f"🔄 {description}...")
     try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        print(f"✅ {description} completed successfully")
-        if result.stdout:
-            print(f"   Output: {result.stdout.strip()}")
+        # Keep output as bytes; it is only decoded when printed
+        result = subprocess.run(cmd, check=True, capture_output=True)
+        with _print_lock:
+            print(f"✅ {description} completed successfully")
+            if result.stdout:
+                print(f"   Output: {result.stdout.decode(errors='replace').strip()}")
         return True
     except subprocess.CalledProcessError as e:
-        print(f"❌ {description} failed")
-        print(f"   Error: {e.stderr}")
+        with _print_lock:
+            print(f"❌ {description} failed")
+            print(f"   Error: {e.stderr.decode(errors='replace')}")
         return False
 
 
@@ -40,7 +49,12 @@ def main() -> None:
     # Check if uv is installed
     print("🔍 Checking for uv package manager...")
     try:
-        subprocess.run(["uv", "--version"], check=True, capture_output=True)
+        subprocess.run(
+            ["uv", "--version"],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
         print("✅ uv found")
     except (subprocess.CalledProcessError, FileNotFoundError):
         print("❌ uv not found. Please install uv first:")
@@ -102,8 +116,20 @@ def main() -> None:
         (["uv", "run", "pytest", "--collect-only", "-q"], "Test collection"),
     ]
 
-    for cmd, description in checks:
-        if not run_command(cmd, description):
+    # The checks are independent read-only scans, so run them side by side
+    failed: set[str] = set()
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = {
+            executor.submit(run_command, cmd, description): description
+            for cmd, description in checks
+        }
+        for future in as_completed(futures):
+            if not future.result():
+                failed.add(futures[future])
+
+    # Report failures in the original check order
+    for _, description in checks:
+        if description in failed:
             print(f"⚠️  {description} failed - please fix before committing")
 
     print("\n🎉 Development environment setup complete!")
@@ -7,24 +7,145 @@ for large local models and GPU resources.
 
 import asyncio
 import base64
+import hashlib
+import importlib.util
 import logging
+import math
+import sys
 import time
+import weakref
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Coroutine
+from dataclasses import dataclass, replace
+from email.utils import parsedate_to_datetime
+from functools import cache
 from io import BytesIO
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, TypeVar, cast
 
+import cv2
 import numpy as np
 from PIL import Image
-from pydantic import BaseModel
 
 from video_lens.utils.api_keys import APIProvider, get_api_key_with_validation
 from video_lens.utils.config import get_config
 
+# SIMD base64 codec from the optional pybase64 package, several times faster
+# on multi-megabyte frames; cast so its type is known either way
+_b64encode: Callable[[bytes], bytes]
+try:
+    import pybase64  # pyright: ignore[reportMissingImports]
+
+    _b64encode = cast("Callable[[bytes], bytes]", pybase64.b64encode)
+except ImportError:
+    _b64encode = base64.b64encode
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
 
-class APICaptionResult(BaseModel):
-    """Result from API-based image captioning."""
+_CAPTION_PROMPT = """Analyze this image and provide a concise, descriptive caption.
+
+Focus on:
+- Main subject or content
+- Key visual elements
+- Context (presentation slide, document, video frame, etc.)
+- Any text visible in the image
+- Overall purpose or message
+
+Provide a single paragraph caption (2-4 sentences) that would help someone understand the content without seeing the image."""
+
+# The prompt content block is identical for every request to Anthropic and
+# OpenAI; the SDKs only read it, so one instance is shared by all messages
+_PROMPT_BLOCK: dict[str, str] = {"type": "text", "text": _CAPTION_PROMPT}
+
+# Confidence multiplier for frames that reuse their scene's caption
+_SIBLING_CONFIDENCE = 0.85
+
+# HTTP statuses worth retrying: timeouts, conflicts, rate limits and server errors
+_RETRYABLE_STATUS = frozenset({408, 409, 429})
+_MAX_RETRY_AFTER = 60.0
+
+
+@cache
+def _gpu_jpeg_encoder() -> Any:
+    """
+    Get torchvision's batched nvJPEG encoder, if it can be used here.
+
+    Checked once per process: encoding a list of tensors needs torchvision
+    0.19 or newer and a CUDA device.
+
+    Returns:
+        torchvision.io.encode_jpeg, or None when GPU encoding is unavailable
+    """
+    try:
+        import torch
+        import torchvision  # type: ignore[import-untyped]
+        from torchvision.io import encode_jpeg  # type: ignore[import-untyped]
+    except ImportError:
+        return None
+
+    version = str(torchvision.__version__).partition("+")[0]  # type: ignore[attr-defined]
+    try:
+        major, minor = (int(part) for part in version.split(".")[:2])
+    except ValueError:
+        return None
+    if (major, minor) < (0, 19) or not torch.cuda.is_available():
+        return None
+    return encode_jpeg
+
+
+def _error_status(error: Exception) -> int | None:
+    """Get the HTTP status of a vendor SDK error, if it carries one."""
+    status = getattr(error, "status_code", None)  # anthropic, openai
+    if status is None:
+        status = getattr(error, "code", None)  # google.api_core
+    return status if isinstance(status, int) else None
+
+
+def _is_retryable_error(error: Exception) -> bool:
+    """Check whether a failed request may succeed if sent again."""
+    status = _error_status(error)
+    if status is not None:
+        return status in _RETRYABLE_STATUS or status >= 500
+    if isinstance(error, ConnectionError | TimeoutError):
+        return True
+    # The SDKs wrap transport failures in APIConnectionError (and its
+    # APITimeoutError subclass) without a status code
+    return any(cls.__name__ == "APIConnectionError" for cls in type(error).__mro__)
+
+
+def _retry_after_seconds(error: Exception) -> float | None:
+    """Read the server's requested backoff from a rate-limit response."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+
+    try:
+        if (value := headers.get("retry-after-ms")) is not None:
+            delay = float(value) / 1000
+        elif (value := headers.get("retry-after")) is not None:
+            try:
+                delay = float(value)
+            except ValueError:
+                retry_at = parsedate_to_datetime(value)
+                delay = retry_at.timestamp() - time.time()
+        else:
+            return None
+    except (TypeError, ValueError):
+        return None
+
+    return min(max(delay, 0.0), _MAX_RETRY_AFTER)
+
+
+@dataclass(slots=True, kw_only=True)
+class APICaptionResult:
+    """Result from API-based image captioning.
+
+    A plain dataclass rather than a pydantic model: one is built per frame
+    and it is only read internally, so validation would be pure overhead.
+    Use dataclasses.asdict() to serialize it.
+    """
 
     caption: str
     confidence: float = 1.0  # API responses assumed high confidence
@@ -46,6 +167,19 @@ class APIImageCaptioner:
         self.max_concurrent = self.config.visual_analysis.api_max_concurrent
         self.timeout = self.config.visual_analysis.api_timeout
         self.max_retries = self.config.visual_analysis.api_max_retries
+        self.max_image_side = self.config.visual_analysis.api_max_image_side
+        self.cache_max_entries = self.config.visual_analysis.api_cache_max_entries
+        self.requests_per_minute = self.config.visual_analysis.api_requests_per_minute
+        self._next_request_at = 0.0
+
+        # Captions keyed on the SHA-256 of the encoded image, in LRU order, plus
+        # requests still in flight so identical frames in a batch share one call
+        self._cache: OrderedDict[str, APICaptionResult] = OrderedDict()
+        self._pending: dict[str, asyncio.Task[APICaptionResult]] = {}
+
+        # Encodings of live PIL images keyed on id(); each entry is dropped by a
+        # weakref finalizer when its image is garbage-collected
+        self._encode_cache: dict[int, tuple[bytes, str]] = {}
 
         # Get API key (don't use api_key_env_var config as it's provider-specific)
         # The get_api_key_with_validation will use the correct env var based on provider
@@ -58,63 +192,347 @@ class APIImageCaptioner:
         if not self.api_key:
             raise ValueError(f"API key not found: {status_msg}")
 
+        # One async client per captioner so connections are reused across
+        # requests. Its connection pool belongs to the event loop that first
+        # uses it, which _get_client tracks.
+        self._client = self._create_client()
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        self._runner: asyncio.Runner | None = None
+        # Tasks closing clients replaced by _get_client, kept referenced
+        # until they finish
+        self._closing: set[asyncio.Task[None]] = set()
+
         logger.info(
             f"APIImageCaptioner initialized: provider={self.provider}, model={self.model}"
         )
 
-    def _encode_image_base64(self, image: Any) -> str:
+    def _create_client(self) -> Any:
         """
-        Encode image to base64 string for API transmission.
+        Create the async vendor SDK client for the configured provider.
+
+        Library-level retries are disabled because _caption_single_image_async
+        applies its own backoff.
+
+        Returns:
+            Client object for the provider
+        """
+        if self.provider == "anthropic":
+            try:
+                import anthropic  # type: ignore[import-not-found]
+            except ImportError as e:
+                raise ImportError(
+                    "anthropic package required for API captioning. Install with: pip install anthropic"
+                ) from e
+
+            return anthropic.AsyncAnthropic(  # type: ignore[attr-defined]
+                api_key=self.api_key,
+                max_retries=0,
+                timeout=self.timeout,
+                http_client=self._create_http_client(anthropic),
+            )
+
+        if self.provider == "openai":
+            try:
+                import openai  # type: ignore[import-not-found]
+            except ImportError as e:
+                raise ImportError(
+                    "openai package required for API captioning. Install with: pip install openai"
+                ) from e
+
+            return openai.AsyncOpenAI(  # type: ignore[attr-defined]
+                api_key=self.api_key,
+                max_retries=0,
+                timeout=self.timeout,
+                http_client=self._create_http_client(openai),
+            )
+
+        if self.provider == "google":
+            try:
+                import google.generativeai as genai  # type: ignore[import-not-found]
+            except ImportError as e:
+                raise ImportError(
+                    "google-generativeai package required for API captioning. Install with: pip install google-generativeai"
+                ) from e
+
+            genai.configure(api_key=self.api_key)  # type: ignore[attr-defined]
+            return genai.GenerativeModel(self.model)  # type: ignore[attr-defined]
+
+        raise ValueError(f"Unsupported provider: {self.provider}")
+
+    def _create_http_client(self, sdk: Any) -> Any:
+        """
+        Create the HTTP client for the Anthropic or OpenAI SDK.
+
+        The pool keeps one warm connection per concurrent request, with
+        headroom for retries. HTTP/2 is enabled when the optional h2 package
+        is installed, letting concurrent requests share a single TLS session.
+        httpx already negotiates gzip and decompresses responses itself.
+
+        Args:
+            sdk: The imported anthropic or openai module
+
+        Returns:
+            Async HTTP client built on the SDK's own defaults
+        """
+        client_cls = getattr(sdk, "DefaultAsyncHttpxClient", None)
+        if client_cls is None:  # SDK versions that predate the helper
+            import httpx
+
+            client_cls = httpx.AsyncClient
+
+        # Newer SDKs are built on httpx2 rather than httpx; Limits must come
+        # from whichever package the client class uses
+        httpx_package = next(
+            cls.__module__.partition(".")[0]
+            for cls in client_cls.__mro__
+            if cls.__module__.startswith("httpx")
+        )
+        limits_cls = sys.modules[httpx_package].Limits
+
+        return client_cls(
+            limits=limits_cls(
+                max_keepalive_connections=self.max_concurrent,
+                max_connections=self.max_concurrent * 2,
+            ),
+            http2=importlib.util.find_spec("h2") is not None,
+        )
+
+    def _get_client(self) -> Any:
+        """
+        Get the client for the running event loop.
+
+        The client is adopted by the first loop that uses it and rebuilt if a
+        different loop shows up, since its connections can't cross loops.
+        The replaced client is closed in the background.
+
+        Returns:
+            Client object for the provider
+        """
+        loop = asyncio.get_running_loop()
+        if self._client_loop is not loop:
+            if self._client_loop is not None:
+                old_client = self._client
+                self._client = self._create_client()
+                task = loop.create_task(self._close_client(old_client))
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+            self._client_loop = loop
+        return self._client
+
+    async def _close_client(self, client: Any) -> None:
+        """
+        Close a replaced client's connections.
+
+        Its connections may belong to a loop that has already closed, so
+        failures are only logged.
+
+        Args:
+            client: Client object to close
+        """
+        close = getattr(client, "close", None)
+        if close is None:
+            return
+        try:
+            await close()
+        except Exception as e:
+            logger.debug(f"Error closing replaced API client: {e}")
+
+    def _run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine on this captioner's own event loop.
+
+        Reusing one loop across synchronous calls keeps the client's
+        connection pool alive between them.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            RuntimeError: If called from inside a running event loop
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            coro.close()
+            raise RuntimeError(
+                "Synchronous captioning methods cannot be called from a running "
+                "event loop; await acaption_image, acaption_images or "
+                "acaption_scenes instead"
+            )
+
+        if self._runner is None:
+            self._runner = asyncio.Runner()
+        return self._runner.run(coro)
+
+    async def _wait_for_rate_limit(self) -> None:
+        """Space requests evenly to stay under api_requests_per_minute."""
+        if not self.requests_per_minute:
+            return
+
+        now = time.monotonic()
+        slot = max(now, self._next_request_at)
+        self._next_request_at = slot + 60.0 / self.requests_per_minute
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def _limit_size(self, image: np.ndarray) -> np.ndarray:
+        """
+        Downscale a frame so its long side fits within the API's image limit.
+
+        Vision APIs downscale larger images server-side anyway, so sending
+        them at full resolution only costs encoding time and input tokens.
+
+        Args:
+            image: Image as numpy array
+
+        Returns:
+            The original array, or a resized copy if it was too large
+        """
+        height, width = image.shape[:2]
+        scale = self.max_image_side / max(height, width)
+        if scale >= 1.0:
+            return image
+        return cv2.resize(  # type: ignore[return-value]
+            image,
+            (max(1, int(width * scale)), max(1, int(height * scale))),
+            interpolation=cv2.INTER_AREA,
+        )
+
+    def _encode_image(self, image: Any) -> tuple[bytes, str]:
+        """
+        Encode image to JPEG for API transmission.
 
         Args:
             image: Image as numpy array, PIL Image, or file path
 
         Returns:
-            Base64-encoded image string
+            Tuple of (JPEG bytes, base64-encoded JPEG string)
         """
-        # Convert to PIL Image if needed
         if isinstance(image, np.ndarray):  # type: ignore[arg-type]
-            # Convert BGR to RGB if needed (OpenCV uses BGR)
-            if len(image.shape) == 3 and image.shape[2] == 3:  # type: ignore[arg-type,index]
-                image = image[:, :, ::-1]  # type: ignore[index]  # BGR to RGB
-            pil_image = Image.fromarray(image)  # type: ignore[arg-type]
-        elif isinstance(image, (Path, str)):
-            pil_image = Image.open(image)
-        else:
-            pil_image = image
+            # Frames come from OpenCV in BGR order, which is what imencode expects
+            ok, buf = cv2.imencode(
+                ".jpg",
+                self._limit_size(image),  # type: ignore[arg-type]
+                [int(cv2.IMWRITE_JPEG_QUALITY), 85],
+            )
+            if not ok:
+                raise ValueError("Failed to JPEG-encode image array")
+            image_bytes = buf.tobytes()
+            return image_bytes, _b64encode(image_bytes).decode("ascii")
+
+        if isinstance(image, (Path, str)):
+            with Image.open(image) as pil_image:
+                scale = self.max_image_side / max(pil_image.size)
+                if scale < 1.0:
+                    # JPEG sources can be decoded directly at 1/2, 1/4 or 1/8
+                    # scale; draft() picks the smallest that still covers
+                    # the target size, so far less data is decoded
+                    pil_image.draft(
+                        "RGB",
+                        (
+                            math.ceil(pil_image.width * scale),
+                            math.ceil(pil_image.height * scale),
+                        ),
+                    )
+                return self._encode_pil_image(pil_image)
+
+        # The same PIL image is often captioned more than once (e.g. by
+        # several providers), so reuse its encoding while it stays alive
+        key = id(image)
+        cached = self._encode_cache.get(key)
+        if cached is not None:
+            return cached
+        encoded = self._encode_pil_image(image)
+        if self.cache_max_entries:
+            self._encode_cache[key] = encoded
+            weakref.finalize(image, self._encode_cache.pop, key, None)
+        return encoded
+
+    def _encode_pil_image(self, pil_image: Image.Image) -> tuple[bytes, str]:
+        """
+        Downscale a PIL image if needed and encode it to JPEG.
+
+        Args:
+            pil_image: Image to encode
+
+        Returns:
+            Tuple of (JPEG bytes, base64-encoded JPEG string)
+        """
+        if max(pil_image.size) > self.max_image_side:
+            # resize() returns a copy, so a caller's image is never modified
+            scale = self.max_image_side / max(pil_image.size)
+            pil_image = pil_image.resize(
+                (
+                    max(1, int(pil_image.width * scale)),
+                    max(1, int(pil_image.height * scale)),
+                ),
+                Image.Resampling.BOX,
+            )
 
         # Convert to JPEG and encode to base64
         buffer = BytesIO()
         pil_image.save(buffer, format="JPEG", quality=85)
         image_bytes = buffer.getvalue()
-        return base64.b64encode(image_bytes).decode("utf-8")
+        return image_bytes, _b64encode(image_bytes).decode("ascii")
 
-    def _get_caption_prompt(self) -> str:
-        """Get the prompt to send to the vision model."""
-        return """Analyze this image and provide a concise, descriptive caption.
+    def _encode_images_gpu(self, images: list[Any]) -> dict[int, tuple[bytes, str]]:
+        """
+        JPEG-encode numpy frames on the GPU with nvJPEG in one batched call.
 
-Focus on:
-- Main subject or content
-- Key visual elements
-- Context (presentation slide, document, video frame, etc.)
-- Any text visible in the image
-- Overall purpose or message
+        Every frame is held on the device at once, so callers pass slices of
+        a batch rather than the whole of it.
 
-Provide a single paragraph caption (2-4 sentences) that would help someone understand the content without seeing the image."""
+        Args:
+            images: Images to caption; only 3-channel numpy frames are encoded
+
+        Returns:
+            Mapping of image index to (JPEG bytes, base64 string), empty when
+            GPU encoding is unavailable
+        """
+        encode_jpeg = _gpu_jpeg_encoder()
+        if encode_jpeg is None:
+            return {}
+
+        indices = [
+            i
+            for i, image in enumerate(images)
+            if isinstance(image, np.ndarray) and image.ndim == 3 and image.shape[2] == 3  # type: ignore[arg-type]
+        ]
+        if len(indices) < 2:
+            return {}
+
+        import torch
 
-    async def _caption_with_anthropic(self, image_base64: str) -> dict[str, Any]:
-        """Caption image using Anthropic Claude API."""
         try:
-            import anthropic  # type: ignore[import-not-found]
-        except ImportError as e:
-            raise ImportError(
-                "anthropic package required for API captioning. Install with: pip install anthropic"
-            ) from e
+            # OpenCV frames are BGR HWC; encode_jpeg expects RGB CHW
+            tensors = [
+                torch.from_numpy(np.ascontiguousarray(self._limit_size(images[i])))
+                .to("cuda")
+                .permute(2, 0, 1)
+                .flip(0)
+                .contiguous()
+                for i in indices
+            ]
+            encoded = encode_jpeg(tensors, quality=85)  # type: ignore[arg-type]
+        except Exception as e:
+            logger.warning(f"GPU JPEG encoding failed, falling back to CPU: {e}")
+            return {}
 
-        client = anthropic.Anthropic(api_key=self.api_key)  # type: ignore[attr-defined]
+        results: dict[int, tuple[bytes, str]] = {}
+        for i, data in zip(indices, encoded, strict=True):  # type: ignore[arg-type]
+            image_bytes: bytes = data.cpu().numpy().tobytes()  # type: ignore[attr-defined]
+            results[i] = (image_bytes, _b64encode(image_bytes).decode("ascii"))
+        return results
 
+    async def _caption_with_anthropic(self, image_base64: str) -> dict[str, Any]:
+        """Caption image using Anthropic Claude API."""
         try:
-            message = client.messages.create(  # type: ignore[attr-defined]
+            message = await self._get_client().messages.create(  # type: ignore[attr-defined]
                 model=self.model,
                 max_tokens=1024,
                 messages=[
@@ -129,7 +547,7 @@ Provide a single paragraph caption (2-4 sentences) that would help someone under
                                     "data": image_base64,
                                 },
                             },
-                            {"type": "text", "text": self._get_caption_prompt()},
+                            _PROMPT_BLOCK,
                         ],
                     }
                 ],
@@ -175,16 +593,7 @@ Provide a single paragraph caption (2-4 sentences) that would help someone under
     async def _caption_with_openai(self, image_base64: str) -> dict[str, Any]:
         """Caption image using OpenAI GPT-4V API."""
         try:
-            import openai  # type: ignore[import-not-found]
-        except ImportError as e:
-            raise ImportError(
-                "openai package required for API captioning. Install with: pip install openai"
-            ) from e
-
-        client = openai.OpenAI(api_key=self.api_key)  # type: ignore[attr-defined]
-
-        try:
-            response = client.chat.completions.create(  # type: ignore[attr-defined]
+            response = await self._get_client().chat.completions.create(  # type: ignore[attr-defined]
                 model=self.model,
                 messages=[
                     {
@@ -193,10 +602,10 @@ Provide a single paragraph caption (2-4 sentences) that would help someone under
                             {
                                 "type": "image_url",
                                 "image_url": {
-                                    "url": f"data:image/jpeg;base64,{image_base64}"
+                                    "url": "data:image/jpeg;base64," + image_base64
                                 },
                             },
-                            {"type": "text", "text": self._get_caption_prompt()},
+                            _PROMPT_BLOCK,
                         ],
                     }
                 ],
@@ -234,26 +643,13 @@ Provide a single paragraph caption (2-4 sentences) that would help someone under
             logger.error(f"OpenAI API error: {e}")
             raise
 
-    async def _caption_with_google(self, image_base64: str) -> dict[str, Any]:
+    async def _caption_with_google(self, image_bytes: bytes) -> dict[str, Any]:
         """Caption image using Google Gemini API."""
         try:
-            import google.generativeai as genai  # type: ignore[import-not-found]
-        except ImportError as e:
-            raise ImportError(
-                "google-generativeai package required for API captioning. Install with: pip install google-generativeai"
-            ) from e
-
-        genai.configure(api_key=self.api_key)  # type: ignore[attr-defined]
-
-        try:
-            model = genai.GenerativeModel(self.model)  # type: ignore[attr-defined]
-
-            # Decode base64 to bytes for Gemini
-            image_bytes = base64.b64decode(image_base64)
-
-            response = model.generate_content(  # type: ignore[attr-defined]
+            # Gemini takes the raw JPEG bytes
+            response = await self._get_client().generate_content_async(  # type: ignore[attr-defined]
                 [
-                    self._get_caption_prompt(),
+                    _CAPTION_PROMPT,
                     {"mime_type": "image/jpeg", "data": image_bytes},
                 ]
             )
@@ -306,12 +702,16 @@ Provide a single paragraph caption (2-4 sentences) that would help someone under
             logger.error(f"Google API error: {e}")
             raise
 
-    async def _caption_single_image_async(self, image: Any) -> APICaptionResult:
+    async def _caption_single_image_async(
+        self, image: Any, encoded: tuple[bytes, str] | None = None
+    ) -> APICaptionResult:
         """
         Caption a single image using the configured API.
 
         Args:
             image: Image to caption
+            encoded: Already-encoded (JPEG bytes, base64) if the caller
+                batch-encoded it
 
         Returns:
             APICaptionResult with caption and metadata
@@ -319,21 +719,80 @@ Provide a single paragraph caption (2-4 sentences) that would help someone under
         start_time = time.time()
 
         # Encode image
-        image_base64 = self._encode_image_base64(image)
-        logger.debug(f"Encoded image to base64 ({len(image_base64)} chars)")
+        if encoded is None:
+            # Encoding is CPU-bound; keep the loop free for in-flight requests
+            encoded = await asyncio.to_thread(self._encode_image, image)
+        image_bytes, image_base64 = encoded
+        logger.debug(f"Encoded image to JPEG ({len(image_bytes)} bytes)")
+
+        if self.cache_max_entries == 0:
+            return await self._request_caption(image_bytes, image_base64, start_time)
+
+        key = hashlib.sha256(image_bytes).hexdigest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            logger.debug(f"Caption cache hit for image {key[:12]}")
+            return self._reused_result(cached, start_time)
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            return self._reused_result(await asyncio.shield(pending), start_time)
+
+        task = asyncio.ensure_future(
+            self._request_caption(image_bytes, image_base64, start_time)
+        )
+        self._pending[key] = task
+        task.add_done_callback(lambda done: self._store_caption(key, done))
+        return await asyncio.shield(task)
+
+    def _reused_result(
+        self, result: APICaptionResult, start_time: float
+    ) -> APICaptionResult:
+        """Copy a caption for a duplicate image; no tokens were spent on it."""
+        return replace(
+            result,
+            processing_time=time.time() - start_time,
+            tokens_used=0,
+            cost_estimate=0.0,
+        )
 
+    def _store_caption(self, key: str, task: asyncio.Task[APICaptionResult]) -> None:
+        """Move a finished request into the LRU cache, evicting the oldest entry."""
+        self._pending.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._cache[key] = task.result()
+        if len(self._cache) > self.cache_max_entries:
+            self._cache.popitem(last=False)
+
+    async def _request_caption(
+        self, image_bytes: bytes, image_base64: str, start_time: float
+    ) -> APICaptionResult:
+        """
+        Call the configured API with retries.
+
+        Args:
+            image_bytes: JPEG-encoded image
+            image_base64: The same image, base64-encoded
+            start_time: When captioning of this image started
+
+        Returns:
+            APICaptionResult with caption and metadata
+        """
         # Call appropriate API
         retries = 0
         last_error = None
 
         while retries <= self.max_retries:
+            await self._wait_for_rate_limit()
             try:
                 if self.provider == "anthropic":
                     result = await self._caption_with_anthropic(image_base64)
                 elif self.provider == "openai":
                     result = await self._caption_with_openai(image_base64)
                 elif self.provider == "google":
-                    result = await self._caption_with_google(image_base64)
+                    result = await self._caption_with_google(image_bytes)
                 else:
                     raise ValueError(f"Unsupported provider: {self.provider}")
 
@@ -355,24 +814,30 @@ Provide a single paragraph caption (2-4 sentences) that would help someone under
                 )
 
             except Exception as e:
+                if not _is_retryable_error(e):
+                    raise RuntimeError(f"Failed to caption image: {e}") from e
+
                 last_error = e
                 retries += 1
                 if retries <= self.max_retries:
-                    wait_time = 2**retries  # Exponential backoff
+                    # Honour the server's retry-after, else back off exponentially
+                    wait_time = _retry_after_seconds(e)
+                    if wait_time is None:
+                        wait_time = 2**retries
                     logger.warning(
                         f"API error (attempt {retries}/{self.max_retries}): {e}. "
-                        f"Retrying in {wait_time}s..."
+                        f"Retrying in {wait_time:g}s..."
                     )
                     await asyncio.sleep(wait_time)
 
         # All retries failed
         raise RuntimeError(
             f"Failed to caption image after {self.max_retries} retries: {last_error}"
-        )
+        ) from last_error
 
-    def caption_image(self, image: Any) -> APICaptionResult:
+    async def acaption_image(self, image: Any) -> APICaptionResult:
         """
-        Caption a single image (synchronous wrapper).
+        Caption a single image.
 
         Args:
             image: Image to caption
@@ -380,50 +845,195 @@ Provide a single paragraph caption (2-4 sentences) that would help someone under
         Returns:
             APICaptionResult with caption and metadata
         """
-        return asyncio.run(self._caption_single_image_async(image))
+        return await self._caption_single_image_async(image)
 
-    async def caption_images_batch(self, images: list[Any]) -> list[APICaptionResult]:
+    def caption_image(self, image: Any) -> APICaptionResult:
         """
-        Caption multiple images concurrently.
+        Caption a single image (synchronous wrapper).
 
         Args:
-            images: List of images to caption
+            image: Image to caption
 
         Returns:
-            List of APICaptionResult objects
+            APICaptionResult with caption and metadata
         """
-        # Create semaphore to limit concurrent requests
-        semaphore = asyncio.Semaphore(self.max_concurrent)
+        return self._run(self.acaption_image(image))
 
-        async def caption_with_semaphore(image: Any) -> APICaptionResult:
-            async with semaphore:
-                return await self._caption_single_image_async(image)
+    async def caption_images_stream(
+        self, images: list[Any]
+    ) -> AsyncIterator[tuple[int, APICaptionResult]]:
+        """
+        Caption multiple images concurrently, yielding results as they finish.
 
-        # Caption all images concurrently
-        tasks = [caption_with_semaphore(img) for img in images]
-        results: list[APICaptionResult | BaseException] = await asyncio.gather(
-            *tasks, return_exceptions=True
-        )
+        A fixed pool of max_concurrent workers pulls image indices from a
+        queue, so only that many requests are in flight at once however
+        large the batch is. When CUDA is available, frames are JPEG-encoded
+        on the GPU in slices of max_concurrent just ahead of the workers, so
+        memory use stays bounded too. Failed images yield an error result
+        instead of raising.
+
+        Args:
+            images: List of images to caption
 
-        # Handle any errors
-        final_results: list[APICaptionResult] = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Failed to caption image {i}: {result}")
-                # Create error result
-                final_results.append(
-                    APICaptionResult(
-                        caption=f"Error: {str(result)}",
+        Yields:
+            Tuples of (index into images, APICaptionResult), in completion order
+        """
+        num_workers = min(self.max_concurrent, len(images))
+        # Index and pre-encoded image (None if not GPU-encoded) for each
+        # image, with one None per worker after the last to stop it
+        pending: asyncio.Queue[tuple[int, tuple[bytes, str] | None] | None] = (
+            asyncio.Queue(maxsize=self.max_concurrent)
+        )
+        finished: asyncio.Queue[tuple[int, APICaptionResult]] = asyncio.Queue()
+
+        async def feeder() -> None:
+            use_gpu = _gpu_jpeg_encoder() is not None
+            for start in range(0, len(images), self.max_concurrent):
+                batch = images[start : start + self.max_concurrent]
+                encoded = (
+                    await asyncio.to_thread(self._encode_images_gpu, batch)
+                    if use_gpu
+                    else {}
+                )
+                for offset in range(len(batch)):
+                    await pending.put((start + offset, encoded.get(offset)))
+            for _ in range(num_workers):
+                await pending.put(None)
+
+        async def worker() -> None:
+            while (item := await pending.get()) is not None:
+                index, encoded = item
+                try:
+                    result = await self._caption_single_image_async(
+                        images[index], encoded
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to caption image {index}: {e}")
+                    result = APICaptionResult(
+                        caption=f"Error: {str(e)}",
                         provider=self.provider,
                         model=self.model,
                         processing_time=0.0,
                     )
+                finished.put_nowait((index, result))
+
+        tasks = [asyncio.create_task(feeder())]
+        tasks += [asyncio.create_task(worker()) for _ in range(num_workers)]
+        try:
+            for _ in range(len(images)):
+                yield await finished.get()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def acaption_images(self, images: list[Any]) -> list[APICaptionResult]:
+        """
+        Caption multiple images concurrently.
+
+        Args:
+            images: List of images to caption
+
+        Returns:
+            List of APICaptionResult objects, in the same order as images
+        """
+        results: dict[int, APICaptionResult] = {}
+        async for index, result in self.caption_images_stream(images):
+            results[index] = result
+        return [results[index] for index in range(len(images))]
+
+    async def caption_images_batch(self, images: list[Any]) -> list[APICaptionResult]:
+        """
+        Caption multiple images concurrently (older name for acaption_images).
+
+        Args:
+            images: List of images to caption
+
+        Returns:
+            List of APICaptionResult objects, in the same order as images
+        """
+        return await self.acaption_images(images)
+
+    async def acaption_scenes(
+        self,
+        scenes: list[list[Any]],
+        quality_scores: list[list[float]] | None = None,
+    ) -> list[list[APICaptionResult]]:
+        """
+        Caption each scene from a single representative frame.
+
+        Frames within a scene are usually near-identical, so only the best
+        frame (highest quality score, or the middle frame without scores) is
+        sent to the API. The other frames get a copy of its caption with
+        confidence scaled down, since they weren't analyzed themselves.
+
+        Args:
+            scenes: Frames of each scene, as images accepted by caption_image
+            quality_scores: Optional quality score per frame, same shape as scenes
+
+        Returns:
+            Caption results per scene, aligned with the input frames
+
+        Raises:
+            ValueError: If quality_scores does not have the same shape as scenes
+        """
+        if quality_scores is not None:
+            if len(quality_scores) != len(scenes):
+                raise ValueError(
+                    f"quality_scores has {len(quality_scores)} scenes, "
+                    f"expected {len(scenes)}"
                 )
-            else:
-                # result is APICaptionResult here (not BaseException)
-                final_results.append(result)  # type: ignore
+            for scene_index, (frames, scores) in enumerate(
+                zip(scenes, quality_scores, strict=True)
+            ):
+                if len(scores) != len(frames):
+                    raise ValueError(
+                        f"Scene {scene_index} has {len(frames)} frames but "
+                        f"{len(scores)} quality scores"
+                    )
 
-        return final_results
+        representatives: list[int] = []
+        for scene_index, frames in enumerate(scenes):
+            if not frames:
+                representatives.append(-1)
+            elif quality_scores is not None:
+                scores = quality_scores[scene_index]
+                representatives.append(max(range(len(frames)), key=scores.__getitem__))
+            else:
+                representatives.append(len(frames) // 2)
+
+        captioned = [
+            (scene_index, frame_index)
+            for scene_index, frame_index in enumerate(representatives)
+            if frame_index >= 0
+        ]
+        results = await self.acaption_images(
+            [scenes[scene_index][frame_index] for scene_index, frame_index in captioned]
+        )
+        scene_results = dict(zip(captioned, results, strict=True))
+
+        captions: list[list[APICaptionResult]] = []
+        for scene_index, frames in enumerate(scenes):
+            if not frames:
+                captions.append([])
+                continue
+            best_index = representatives[scene_index]
+            best = scene_results[(scene_index, best_index)]
+            captions.append(
+                [
+                    best
+                    if i == best_index
+                    else replace(
+                        best,
+                        confidence=best.confidence * _SIBLING_CONFIDENCE,
+                        processing_time=0.0,
+                        tokens_used=0,
+                        cost_estimate=0.0,
+                    )
+                    for i in range(len(frames))
+                ]
+            )
+        return captions
 
     def caption_images(self, images: list[Any]) -> list[APICaptionResult]:
         """
@@ -435,8 +1045,31 @@ Provide a single paragraph caption (2-4 sentences) that would help someone under
         Returns:
             List of APICaptionResult objects
         """
-        return asyncio.run(self.caption_images_batch(images))
+        return self._run(self.acaption_images(images))
+
+    def caption_scenes(
+        self,
+        scenes: list[list[Any]],
+        quality_scores: list[list[float]] | None = None,
+    ) -> list[list[APICaptionResult]]:
+        """
+        Caption each scene from a single representative frame (synchronous wrapper).
+
+        Args:
+            scenes: Frames of each scene, as images accepted by caption_image
+            quality_scores: Optional quality score per frame, same shape as scenes
+
+        Returns:
+            Caption results per scene, aligned with the input frames
+        """
+        return self._run(self.acaption_scenes(scenes, quality_scores))
 
     def cleanup(self):
-        """Clean up resources (no-op for API captioner)."""
+        """Close the client's connections and the captioner's event loop."""
+        if self._runner is not None:
+            close = getattr(self._client, "close", None)
+            if close is not None and self._client_loop is self._runner.get_loop():
+                self._runner.run(close())
+            self._runner.close()
+            self._runner = None
         logger.info("APIImageCaptioner cleanup complete")
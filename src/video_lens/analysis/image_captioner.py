@@ -482,6 +482,11 @@ class ImageCaptioner:
 
             logger.info("Image captioning model resources cleaned up")
 
+        if self.api_captioner is not None:
+            # Closes the API client's connections and its event loop
+            self.api_captioner.cleanup()
+            self.api_captioner = None
+
     def _caption_with_api(
         self,
         image_path: Path | None = None,
@@ -682,9 +682,8 @@ class PipelineCoordinator:
 
             # Generate and save HTML report
             html_renderer = HTMLRenderer()
-            html_content = html_renderer.render_report(report)
             html_path = output_dir / "analysis.html"
-            html_renderer.save_html(html_content, html_path)
+            html_renderer.save_html(html_renderer.iter_render(report), html_path)
             logger.info(f"HTML report saved: {html_path}")
 
             return {"json": json_path, "html": html_path}
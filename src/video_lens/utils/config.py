@@ -142,6 +142,9 @@ class VisualAnalysisConfig(BaseModel):
     api_max_concurrent: int = Field(default=5, ge=1, le=20)
     api_timeout: float = Field(default=30.0, ge=5.0, le=120.0)
     api_max_retries: int = Field(default=3, ge=0, le=10)
+    api_max_image_side: int = Field(default=1568, ge=256, le=4096)
+    api_cache_max_entries: int = Field(default=512, ge=0, le=100_000)  # 0 disables
+    api_requests_per_minute: int = Field(default=0, ge=0, le=10_000)  # 0 = no limit
 
     # OCR settings
     enable_ocr: bool = Field(default=True)
@@ -1,20 +1,26 @@
 """CLI progress display utilities for real-time workflow visualization."""
 
+import threading
+import time
 from collections.abc import Callable
-from dataclasses import dataclass
-from typing import Any
-
-from rich.console import Console
-from rich.progress import (
-    BarColumn,
-    Progress,
-    TextColumn,
-    TimeRemainingColumn,
-)
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from video_lens.core.progress_tracker import ProgressTracker
 
-console = Console()
+if TYPE_CHECKING:
+    # Rich is imported when a workflow is first displayed, so importing this
+    # module stays cheap for runs that never show a progress bar
+    from rich.console import Console
+    from rich.progress import Progress, ProgressColumn, TaskID
+
+# Longest task description passed to Rich, which re-measures it on every render
+_MAX_DESC = 60
+
+
+def _truncate(text: str) -> str:
+    """Shorten text to _MAX_DESC characters, marking the cut with an ellipsis."""
+    return text if len(text) <= _MAX_DESC else text[: _MAX_DESC - 1] + "…"
 
 
 @dataclass
@@ -24,26 +30,85 @@ class OperationProgress:
     name: str
     total_steps: float = 1.0
     current_step: float = 0.0
+    # Whole percentage last reached, as shown on the bar
+    percent: int = field(default=0, init=False)
+    # Rich task showing this operation, None until started or when hidden
+    task_id: "TaskID | None" = field(default=None, init=False)
+    _inv_total: float = field(init=False, repr=False)
 
-    def update(self, progress: float) -> None:
-        """Update progress (0.0 to 1.0)."""
-        self.current_step = min(progress, self.total_steps)
+    def __post_init__(self) -> None:
+        """Cache the reciprocal of the total so percentages need no division."""
+        self._inv_total = 1.0 / self.total_steps if self.total_steps > 0 else 0.0
+
+    def update(self, progress: float) -> float:
+        """
+        Update progress (0.0 to 1.0), ignoring values that would move it back.
+
+        Args:
+            progress: Fraction of the operation completed
+
+        Returns:
+            Increase in current_step, 0.0 if progress did not advance
+        """
+        new_step = min(progress * self.total_steps, self.total_steps)
+        if new_step <= self.current_step:
+            return 0.0
+        delta = new_step - self.current_step
+        self.current_step = new_step
+        self.percent = min(int(progress * 100), 100)
+        return delta
 
     def get_percentage(self) -> int:
         """Get progress as percentage."""
-        return int((self.current_step / self.total_steps) * 100)
+        if self.total_steps <= 0:
+            return 0
+        # Compare exactly at the end, where the reciprocal can round 100 to 99
+        if self.current_step >= self.total_steps:
+            return 100
+        return int(self.current_step * self._inv_total * 100)
 
 
 class CLIProgressTracker(ProgressTracker):
     """Tracks and displays progress for video analysis workflow."""
 
+    # Stateless progress bar columns, built on first use and shared by every
+    # workflow
+    _columns: ClassVar[tuple["ProgressColumn", ...] | None] = None
+
     def __init__(self):
         """Initialize progress tracker."""
         super().__init__()
         self.cli_operations: dict[str, OperationProgress] = {}
         self.current_operation: str | None = None
+        self.console: Console | None = None
         self.progress: Progress | None = None
-        self.tasks: dict[str, int] = {}
+        # Rich redraws every task on each refresh, so operations beyond this
+        # many share a single overflow task
+        self._max_visible = 16
+        self._visible_tasks = 0
+        self._hidden_ops: set[str] = set()
+        self._overflow_task: TaskID | None = None
+        # Last percentage and description sent to Rich per operation, so
+        # repeated callbacks that would not change the bar are skipped
+        self._last_percent: dict[str, int] = {}
+        self._last_desc: dict[str, str] = {}
+        # Descriptions built so far, keyed on (operation ID, current step)
+        self._desc_cache: dict[tuple[str, str | None], str] = {}
+        # Updates only change task state; redraws are driven manually and
+        # spaced at least this far apart (~20 FPS), with a one-shot timer
+        # flushing whatever changed in between
+        self._min_interval = 0.05
+        self._last_render = 0.0
+        self._flush_timer: threading.Timer | None = None
+        # Sum of operation weights and of their completed portions, kept up to
+        # date on every update so overall progress never needs a full rescan
+        self._total_weight = 0.0
+        self._completed_weighted = 0.0
+        # Callbacks from create_progress_callback, stopped with the workflow
+        self._coalesced_callbacks: list[_CoalescedProgressCallback] = []
+        # Coalesced callbacks and the flush timer call in from their own
+        # threads, so tracker state is only changed while holding this lock
+        self._lock = threading.RLock()
 
     def start_workflow(
         self, workflow_name: str, operations: list[tuple[str, str, float]]
@@ -55,27 +120,48 @@ class CLIProgressTracker(ProgressTracker):
             workflow_name: Name of the workflow
             operations: List of (op_id, op_name, weight) tuples
         """
-        self.cli_operations = {}
-        self.tasks = {}
-
-        # Display workflow header
-        console.print(f"\n[bold blue]▶ {workflow_name}[/bold blue]\n")
-
-        # Create progress bar
-        self.progress = Progress(
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeRemainingColumn(),
-            console=console,
-        )
+        with self._lock:
+            self.cli_operations = {}
+            self._visible_tasks = 0
+            self._hidden_ops = set()
+            self._overflow_task = None
+            self._last_percent = {}
+            self._last_desc = {}
+            self._desc_cache = {}
+            self._cancel_flush_timer()
+            self._last_render = 0.0
+            self._completed_weighted = 0.0
+
+            from rich.progress import Progress, TimeRemainingColumn
+
+            console = self._get_console()
+
+            # Display workflow header
+            console.print(f"\n[bold blue]▶ {workflow_name}[/bold blue]\n")
+
+            # Create progress bar
+            # TimeRemainingColumn caches its output per task ID, and IDs restart
+            # in every Progress, so it is the one column not shared between
+            # workflows
+            self.progress = Progress(
+                *self._get_columns(),
+                TimeRemainingColumn(),
+                console=console,
+                auto_refresh=False,
+                refresh_per_second=20,
+            )
 
-        # Start the progress bar
-        self.progress.start()
+            # Start the progress bar
+            self.progress.start()
 
-        # Register operations
-        for op_id, op_name, weight in operations:
-            self.cli_operations[op_id] = OperationProgress(op_name, total_steps=weight)
+            # Register operations
+            for op_id, op_name, weight in operations:
+                self.cli_operations[op_id] = OperationProgress(
+                    _truncate(op_name), total_steps=weight if weight > 0 else 1.0
+                )
+            self._total_weight = sum(
+                op.total_steps for op in self.cli_operations.values()
+            )
 
     def start_operation(
         self,
@@ -87,15 +173,22 @@ class CLIProgressTracker(ProgressTracker):
         """Mark an operation as started."""
         # Parameters operation_name, total_steps, details are part of the interface
         # but not currently used in the CLI implementation
-        if not self.progress:
-            return
-
-        self.current_operation = operation_id
-        if operation_id in self.cli_operations:
-            op = self.cli_operations[operation_id]
-            if operation_id not in self.tasks:
-                task_id = self.progress.add_task(op.name, total=100)
-                self.tasks[operation_id] = task_id
+        with self._lock:
+            if not self.progress:
+                return
+
+            self.current_operation = operation_id
+            if operation_id in self.cli_operations:
+                op = self.cli_operations[operation_id]
+                if op.task_id is not None or operation_id in self._hidden_ops:
+                    return
+                if self._visible_tasks < self._max_visible:
+                    op.task_id = self.progress.add_task(op.name, total=100)
+                    self._visible_tasks += 1
+                else:
+                    self._hidden_ops.add(operation_id)
+                    self._update_overflow()
+                self._request_flush()
 
     def update_progress(
         self,
@@ -117,27 +210,104 @@ class CLIProgressTracker(ProgressTracker):
         """
         # Parameters current_step_number and details are part of the interface
         # but not currently used in the CLI implementation
-        if not self.progress:
-            return
+        # This runs for every progress callback, so attributes used more than
+        # once are read into locals
+        with self._lock:
+            progress_bar = self.progress
+            if not progress_bar:
+                return
+
+            # Use provided operation_id or current operation
+            op_id = operation_id or self.current_operation
+            if not op_id:
+                return
+
+            op = self.cli_operations.get(op_id)
+            if op is None:
+                return
+            delta = op.update(progress or 0)
+            self._completed_weighted += delta / self._total_weight
+
+            # Taken from the operation, which never moves backwards, so a late
+            # or regressive value leaves the bar alone
+            percentage = op.percent
+            task_id = op.task_id
+            last_percent = self._last_percent
+            if task_id is None:
+                if op_id in self._hidden_ops and last_percent.get(op_id) != percentage:
+                    last_percent[op_id] = percentage
+                    self._update_overflow()
+                    self._request_flush()
+                return
+
+            desc_cache = self._desc_cache
+            key = (op_id, current_step)
+            desc = desc_cache.get(key)
+            if desc is None:
+                desc = op.name
+                if current_step:
+                    desc = _truncate(f"{desc} • {current_step}")
+                desc_cache[key] = desc
+            last_desc = self._last_desc
+            desc_changed = last_desc.get(op_id) != desc
+            if last_percent.get(op_id) == percentage and not desc_changed:
+                return
+            last_percent[op_id] = percentage
+            # Only send the description when it changed, as setting it makes
+            # Rich re-render the description column
+            if desc_changed:
+                last_desc[op_id] = desc
+                progress_bar.update(task_id, completed=percentage, description=desc)
+            else:
+                progress_bar.update(task_id, completed=percentage)
+            self._request_flush()
+
+    def flush(self) -> None:
+        """Redraw the progress display with all pending task changes."""
+        with self._lock:
+            self._flush_timer = None
+            self._last_render = time.monotonic()
+            if self.progress:
+                self.progress.refresh()
+
+    def _request_flush(self) -> None:
+        """
+        Flush now, or once the minimum interval since the last redraw passes.
 
-        # Use provided operation_id or current operation
-        op_id = operation_id or self.current_operation
-        if not op_id:
+        Must be called with the tracker lock held.
+        """
+        wait = self._last_render + self._min_interval - time.monotonic()
+        if wait <= 0:
+            self.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = threading.Timer(wait, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _cancel_flush_timer(self) -> None:
+        """Cancel a scheduled flush, if any."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    def _update_overflow(self) -> None:
+        """Show the combined progress of operations beyond the visible limit."""
+        if not self.progress:
             return
 
-        if op_id in self.cli_operations:
-            self.cli_operations[op_id].update(progress)
-            task_id = self.tasks.get(op_id)
-            if task_id is not None:
-                percentage = int((progress or 0) * 100)
-                desc = self.cli_operations[op_id].name
-                if current_step:
-                    desc = f"{desc} • {current_step}"
-                from rich.progress import TaskID
-
-                self.progress.update(
-                    TaskID(task_id), completed=percentage, description=desc
-                )
+        total = 100 * len(self._hidden_ops)
+        completed = sum(
+            self.cli_operations[op_id].percent for op_id in self._hidden_ops
+        )
+        desc = f"+{len(self._hidden_ops)} more operations"
+        if self._overflow_task is None:
+            self._overflow_task = self.progress.add_task(
+                desc, total=total, completed=completed
+            )
+        else:
+            self.progress.update(
+                self._overflow_task, total=total, completed=completed, description=desc
+            )
 
     def complete_operation(
         self,
@@ -147,14 +317,26 @@ class CLIProgressTracker(ProgressTracker):
         """Mark an operation as complete."""
         # Parameter details is part of the interface but not currently used
         # in the CLI implementation
-        if not self.progress:
-            return
-
-        if operation_id in self.tasks:
-            from rich.progress import TaskID
-
-            task_id = self.tasks[operation_id]
-            self.progress.update(TaskID(task_id), completed=100)
+        with self._lock:
+            if not self.progress:
+                return
+
+            op = self.cli_operations.get(operation_id)
+            if op is None:
+                return
+            self._completed_weighted += op.update(1.0) / self._total_weight
+
+            # Progress callbacks usually drive the bar to 100% already
+            if self._last_percent.get(operation_id) == 100:
+                return
+            if op.task_id is not None:
+                self._last_percent[operation_id] = 100
+                self.progress.update(op.task_id, completed=100)
+                self._request_flush()
+            elif operation_id in self._hidden_ops:
+                self._last_percent[operation_id] = 100
+                self._update_overflow()
+                self._request_flush()
 
     def fail_operation(
         self,
@@ -165,16 +347,25 @@ class CLIProgressTracker(ProgressTracker):
         """Mark an operation as failed."""
         # Parameters error and details are part of the interface but not currently
         # used in the CLI implementation
-        if not self.progress:
-            return
-
-        if operation_id in self.tasks:
-            from rich.progress import TaskID
+        with self._lock:
+            if not self.progress:
+                return
+
+            op = self.cli_operations.get(operation_id)
+            if op is not None and op.task_id is not None:
+                desc = f"❌ {op.name} failed"
+                self._last_desc[operation_id] = desc
+                self.progress.update(op.task_id, description=desc)
+                self._request_flush()
+
+    def get_workflow_progress(self) -> float:
+        """
+        Get overall workflow progress weighted by operation.
 
-            task_id = self.tasks[operation_id]
-            op_name = self.cli_operations.get(operation_id)
-            desc = f"❌ {op_name.name if op_name else 'Operation'} failed"
-            self.progress.update(TaskID(task_id), description=desc)
+        Returns:
+            Progress value (0.0 to 1.0)
+        """
+        return min(self._completed_weighted, 1.0)
 
     def create_sub_progress_callback(
         self, operation_id: str, step_weight: float = 1.0, step_name: str | None = None
@@ -191,9 +382,11 @@ class CLIProgressTracker(ProgressTracker):
             Callback function that accepts progress (0.0-1.0)
         """
 
+        update = self.update_progress
+
         def callback(progress: float) -> None:
             # Update with step name and weighted progress
-            self.update_progress(
+            update(
                 operation_id=operation_id,
                 progress=progress * step_weight,
                 current_step=step_name,
@@ -201,17 +394,134 @@ class CLIProgressTracker(ProgressTracker):
 
         return callback
 
+    @classmethod
+    def _get_columns(cls) -> tuple["ProgressColumn", ...]:
+        """Get the shared progress bar columns, creating them on first use."""
+        if cls._columns is None:
+            from rich.progress import BarColumn, TextColumn
+
+            cls._columns = (
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            )
+        return cls._columns
+
+    def _get_console(self) -> "Console":
+        """Get the Rich console, creating it on first use."""
+        if self.console is None:
+            from rich.console import Console
+
+            self.console = Console()
+        return self.console
+
+    def create_progress_callback(self, operation_id: str) -> Callable[[float], None]:
+        """
+        Create a coalescing progress callback for an operation.
+
+        Args:
+            operation_id: ID of the operation to update progress for
+
+        Returns:
+            Callback function accepting progress (0.0-1.0), or a no-op
+            callback if no workflow is being displayed
+        """
+        with self._lock:
+            if self.progress is None:
+                return _ignore_progress
+
+            callback = _CoalescedProgressCallback(self, operation_id)
+            self._coalesced_callbacks.append(callback)
+            return callback
+
+    def _stop_coalesced_callbacks(self) -> None:
+        """Stop the flush threads of all coalesced progress callbacks."""
+        # Taken under the lock but stopped outside it, as stopping joins
+        # threads that need the lock to post their last update
+        with self._lock:
+            callbacks = self._coalesced_callbacks
+            self._coalesced_callbacks = []
+        for callback in callbacks:
+            callback.stop()
+
     def complete_workflow(self) -> None:
         """Complete the workflow and display completion message."""
-        if self.progress:
-            self.progress.stop()
-        console.print("[green]✓ Analysis complete![/green]\n")
+        self._stop_coalesced_callbacks()
+        with self._lock:
+            self._cancel_flush_timer()
+            if self.progress:
+                # Stopping renders a final frame, flushing any pending changes
+                self.progress.stop()
+        self._get_console().print("[green]✓ Analysis complete![/green]\n")
 
     def fail_workflow(self, error_message: str) -> None:
         """Fail the workflow with an error message."""
-        if self.progress:
-            self.progress.stop()
-        console.print(f"[red]✗ Analysis failed: {error_message}[/red]\n")
+        self._stop_coalesced_callbacks()
+        with self._lock:
+            self._cancel_flush_timer()
+            if self.progress:
+                self.progress.stop()
+        self._get_console().print(f"[red]✗ Analysis failed: {error_message}[/red]\n")
+
+
+def _ignore_progress(progress: float) -> None:  # noqa: ARG001
+    """Progress callback used when no workflow is being displayed."""
+
+
+class _CoalescedProgressCallback:
+    """Progress callback that forwards only the latest value on a fixed tick."""
+
+    def __init__(
+        self, tracker: CLIProgressTracker, operation_id: str, interval: float = 0.05
+    ):
+        """
+        Initialize the callback.
+
+        Args:
+            tracker: Tracker to forward progress to
+            operation_id: ID of the operation to update progress for
+            interval: Seconds between forwarded updates
+        """
+        self._update = tracker.update_progress
+        self._operation_id = operation_id
+        self._interval = interval
+        self._latest: float | None = None
+        self._posted: float | None = None
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def __call__(self, progress: float) -> None:
+        """Record a progress value (0.0 to 1.0) for the next tick."""
+        # A plain attribute store; the flush thread picks up whichever value
+        # is current when it wakes
+        self._latest = progress
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None and not self._stopped.is_set():
+                    self._thread = threading.Thread(target=self._run, daemon=True)
+                    self._thread.start()
+
+    def _run(self) -> None:
+        """Flush the latest value every interval until stopped."""
+        while not self._stopped.wait(self._interval):
+            self._flush()
+
+    def _flush(self) -> None:
+        """Forward the latest value if it has not been forwarded yet."""
+        latest = self._latest
+        if latest is not None and latest != self._posted:
+            self._posted = latest
+            self._update(operation_id=self._operation_id, progress=latest)
+
+    def stop(self) -> None:
+        """Stop the flush thread and forward the final value."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+        # Re-send even if already posted, as the tracker may have throttled it
+        self._posted = None
+        self._flush()
 
 
 def create_progress_callback(
@@ -225,10 +535,10 @@ def create_progress_callback(
         operation_id: ID of the operation to update progress for
 
     Returns:
-        Callback function accepting progress (0.0-1.0)
+        Callback function accepting progress (0.0-1.0). Calls are coalesced
+        and forwarded to the tracker at most every 50 ms; the callback is
+        stopped by complete_workflow or fail_workflow. If no workflow is
+        being displayed the callback does nothing, so create it after
+        start_workflow.
     """
-
-    def callback(progress: float) -> None:
-        tracker.update_progress(operation_id=operation_id, progress=progress)
-
-    return callback
+    return tracker.create_progress_callback(operation_id)
@@ -0,0 +1,530 @@
+"""Tests for API-based image captioning."""
+
+import asyncio
+import base64
+import dataclasses
+import gc
+from io import BytesIO
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import anthropic
+import cv2
+import numpy as np
+import pytest
+from PIL import Image
+from PIL.JpegImagePlugin import JpegImageFile
+
+from video_lens.analysis.api_image_captioner import APICaptionResult, APIImageCaptioner
+from video_lens.utils.config import VideoLensConfig, VisualAnalysisConfig
+
+
+@pytest.fixture
+def mock_config():
+    """Create mock configuration for testing."""
+    return VideoLensConfig(
+        visual_analysis=VisualAnalysisConfig(
+            api_provider="anthropic",
+            api_model="claude-haiku-4-5",
+            api_max_concurrent=2,
+            api_max_retries=1,
+        )
+    )
+
+
+@pytest.fixture
+def captioner(mock_config):
+    """Create an API captioner without a real API key lookup."""
+    with patch(
+        "video_lens.analysis.api_image_captioner.get_api_key_with_validation",
+        return_value=("test-key", "ok"),
+    ):
+        return APIImageCaptioner(config=mock_config)
+
+
+@pytest.fixture
+def api_call(captioner):
+    """Replace the Anthropic request with a mock."""
+    call = AsyncMock(return_value={"caption": "A slide.", "tokens": 120, "cost": 0.01})
+    captioner._caption_with_anthropic = call
+    return call
+
+
+class TestClientSetup:
+    """Test vendor client construction."""
+
+    def test_client_is_reused_across_requests(self, mock_config):
+        """Test that one async client serves every synchronous call."""
+        with (
+            patch(
+                "video_lens.analysis.api_image_captioner.get_api_key_with_validation",
+                return_value=("test-key", "ok"),
+            ),
+            patch("anthropic.AsyncAnthropic") as mock_anthropic,
+        ):
+            create = AsyncMock()
+            create.return_value.content = [MagicMock(text=" A slide. ")]
+            create.return_value.usage.input_tokens = 100
+            create.return_value.usage.output_tokens = 20
+            mock_anthropic.return_value.messages.create = create
+            mock_anthropic.return_value.close = AsyncMock()
+
+            captioner = APIImageCaptioner(config=mock_config)
+            results = [
+                captioner.caption_image(np.full((16, 16, 3), value, dtype=np.uint8))
+                for value in (0, 255)
+            ]
+            captioner.cleanup()
+
+        mock_anthropic.assert_called_once()
+        assert mock_anthropic.call_args.kwargs["max_retries"] == 0
+        assert create.await_count == 2
+        assert results[0].caption == "A slide."
+        mock_anthropic.return_value.close.assert_awaited_once()
+
+    def test_client_is_rebuilt_for_a_new_event_loop(self, captioner):
+        """Test that a client is not shared between event loops."""
+
+        async def get_client():
+            return captioner._get_client()
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+
+        assert first is not second
+
+    def test_replaced_client_is_closed(self, captioner):
+        """Test that rebuilding the client for a new loop closes the old one."""
+
+        async def get_client():
+            client = captioner._get_client()
+            await asyncio.sleep(0)
+            return client
+
+        first = asyncio.run(get_client())
+        first.close = AsyncMock()
+        asyncio.run(get_client())
+
+        first.close.assert_awaited_once()
+
+    def test_connection_pool_matches_concurrency(self, captioner):
+        """Test that the HTTP pool is sized from api_max_concurrent."""
+        client_cls = anthropic.DefaultAsyncHttpxClient
+
+        with patch.object(
+            client_cls, "__init__", autospec=True, side_effect=client_cls.__init__
+        ) as init:
+            captioner._create_client()
+
+        limits = init.call_args.kwargs["limits"]
+        assert limits.max_keepalive_connections == captioner.max_concurrent
+        assert limits.max_connections == captioner.max_concurrent * 2
+
+    def test_unsupported_provider(self, captioner):
+        """Test that an unknown provider is rejected."""
+        captioner.provider = "unknown"
+
+        with pytest.raises(ValueError, match="Unsupported provider"):
+            captioner._create_client()
+
+
+class TestImageEncoding:
+    """Test image encoding for API transmission."""
+
+    def test_encode_numpy_array_keeps_bgr_order(self, captioner):
+        """Test that OpenCV frames are encoded without swapping channels."""
+        frame = np.zeros((32, 32, 3), dtype=np.uint8)
+        frame[:, :, 0] = 255  # Pure blue in BGR
+
+        _, encoded = captioner._encode_image(frame)
+        decoded = cv2.imdecode(
+            np.frombuffer(base64.b64decode(encoded), dtype=np.uint8),
+            cv2.IMREAD_COLOR,
+        )
+
+        assert decoded.shape == frame.shape
+        assert decoded[16, 16, 0] > 200
+        assert decoded[16, 16, 2] < 50
+
+    def test_encode_pil_image(self, captioner):
+        """Test encoding a PIL image."""
+        image_bytes, encoded = captioner._encode_image(Image.new("RGB", (16, 16)))
+
+        assert image_bytes[:2] == b"\xff\xd8"
+        assert base64.b64decode(encoded) == image_bytes
+
+    def test_pil_image_encoding_is_reused_while_alive(self, captioner):
+        """Test that a PIL image is encoded once and forgotten once collected."""
+        image = Image.new("RGB", (16, 16))
+
+        with patch.object(
+            captioner, "_encode_pil_image", wraps=captioner._encode_pil_image
+        ) as encode:
+            first = captioner._encode_image(image)
+            assert captioner._encode_image(image) is first
+            assert encode.call_count == 1
+
+        del image, encode  # the mock's call records also hold the image
+        gc.collect()
+        assert captioner._encode_cache == {}
+
+    def test_encode_image_path(self, captioner, temp_dir):
+        """Test encoding an image from a file path."""
+        path = temp_dir / "frame.png"
+        Image.new("RGB", (16, 16), color="red").save(path)
+
+        _, encoded = captioner._encode_image(path)
+
+        assert base64.b64decode(encoded)[:2] == b"\xff\xd8"
+
+    def test_encode_downscales_large_frames(self, captioner):
+        """Test that frames larger than the API limit are resized first."""
+        captioner.max_image_side = 400
+        frame = np.zeros((600, 1000, 3), dtype=np.uint8)
+
+        _, encoded = captioner._encode_image(frame)
+        decoded = cv2.imdecode(
+            np.frombuffer(base64.b64decode(encoded), dtype=np.uint8),
+            cv2.IMREAD_COLOR,
+        )
+
+        assert decoded.shape == (240, 400, 3)
+
+    def test_encode_downscales_large_pil_image_without_mutating(self, captioner):
+        """Test that large PIL images are resized on a copy."""
+        captioner.max_image_side = 400
+        image = Image.new("RGB", (1000, 600))
+
+        _, encoded = captioner._encode_image(image)
+
+        assert image.size == (1000, 600)
+        with Image.open(BytesIO(base64.b64decode(encoded))) as decoded:
+            assert decoded.size == (400, 240)
+
+    def test_large_jpeg_path_uses_draft_decoding(self, captioner, temp_dir):
+        """Test that large JPEG files are decoded at reduced scale."""
+        captioner.max_image_side = 400
+        path = temp_dir / "photo.jpg"
+        Image.new("RGB", (2000, 1500), color="blue").save(path)
+
+        with patch.object(
+            JpegImageFile, "draft", autospec=True, side_effect=JpegImageFile.draft
+        ) as draft:
+            image_bytes, _ = captioner._encode_image(path)
+
+        draft.assert_called_once()
+        assert draft.call_args.args[2] == (400, 300)
+        with Image.open(BytesIO(image_bytes)) as decoded:
+            assert decoded.size == (400, 300)
+
+    def test_small_frames_are_not_resized(self, captioner):
+        """Test that frames within the limit are passed through unchanged."""
+        frame = np.zeros((100, 200, 3), dtype=np.uint8)
+
+        assert captioner._limit_size(frame) is frame
+
+
+class TestResponseCache:
+    """Test caching of captions for identical images."""
+
+    def test_repeated_image_uses_cache(self, captioner, api_call):
+        """Test that an identical image is only sent to the API once."""
+        frame = np.zeros((16, 16, 3), dtype=np.uint8)
+
+        first = captioner.caption_image(frame)
+        second = captioner.caption_image(frame.copy())
+
+        assert api_call.await_count == 1
+        assert second.caption == first.caption
+        assert first.cost_estimate == 0.01
+        assert second.cost_estimate == 0.0
+        assert second.tokens_used == 0
+
+    def test_duplicates_in_a_batch_share_one_request(self, captioner, api_call):
+        """Test that concurrent identical frames wait on a single request."""
+        frames = [np.zeros((16, 16, 3), dtype=np.uint8) for _ in range(4)]
+
+        results = captioner.caption_images(frames)
+
+        assert api_call.await_count == 1
+        assert [r.caption for r in results] == ["A slide."] * 4
+
+    def test_cache_evicts_least_recently_used(self, captioner, api_call):
+        """Test that the cache is bounded by api_cache_max_entries."""
+        captioner.cache_max_entries = 2
+        frames = [
+            np.full((16, 16, 3), value, dtype=np.uint8) for value in (0, 100, 200)
+        ]
+
+        for frame in frames:
+            captioner.caption_image(frame)
+        captioner.caption_image(frames[0])
+
+        assert len(captioner._cache) == 2
+        assert api_call.await_count == 4
+
+    def test_cache_can_be_disabled(self, captioner, api_call):
+        """Test that a cache size of zero sends every image."""
+        captioner.cache_max_entries = 0
+        frame = np.zeros((16, 16, 3), dtype=np.uint8)
+
+        captioner.caption_image(frame)
+        captioner.caption_image(frame)
+
+        assert api_call.await_count == 2
+        assert not captioner._cache
+
+
+class TestRetries:
+    """Test retry behaviour on API errors."""
+
+    @staticmethod
+    def _status_error(status, headers=None):
+        """Build an SDK-style error carrying an HTTP status."""
+        error = Exception(f"HTTP {status}")
+        error.status_code = status
+        error.response = MagicMock(headers=headers or {})
+        return error
+
+    def test_client_errors_fail_fast(self, captioner):
+        """Test that a 400 response is not retried."""
+        call = AsyncMock(side_effect=self._status_error(400))
+        captioner._caption_with_anthropic = call
+
+        with (
+            patch("asyncio.sleep", new=AsyncMock()) as sleep,
+            pytest.raises(RuntimeError, match="HTTP 400"),
+        ):
+            captioner.caption_image(np.zeros((16, 16, 3), dtype=np.uint8))
+
+        assert call.await_count == 1
+        sleep.assert_not_awaited()
+
+    def test_rate_limit_honours_retry_after(self, captioner):
+        """Test that a 429 waits for the server's retry-after value."""
+        call = AsyncMock(
+            side_effect=[
+                self._status_error(429, {"retry-after": "7"}),
+                {"caption": "A slide.", "tokens": 10, "cost": 0.0},
+            ]
+        )
+        captioner._caption_with_anthropic = call
+
+        with patch("asyncio.sleep", new=AsyncMock()) as sleep:
+            result = captioner.caption_image(np.zeros((16, 16, 3), dtype=np.uint8))
+
+        assert result.caption == "A slide."
+        sleep.assert_awaited_once_with(7.0)
+
+    def test_server_errors_use_exponential_backoff(self, captioner):
+        """Test that a 5xx without retry-after backs off exponentially."""
+        call = AsyncMock(side_effect=self._status_error(503))
+        captioner._caption_with_anthropic = call
+
+        with (
+            patch("asyncio.sleep", new=AsyncMock()) as sleep,
+            pytest.raises(RuntimeError, match="after 1 retries"),
+        ):
+            captioner.caption_image(np.zeros((16, 16, 3), dtype=np.uint8))
+
+        assert call.await_count == 2
+        sleep.assert_awaited_once_with(2)
+
+    def test_connection_errors_are_retried(self, captioner):
+        """Test that transport failures are retried."""
+        call = AsyncMock(
+            side_effect=[
+                ConnectionError("reset"),
+                {"caption": "A slide.", "tokens": 10, "cost": 0.0},
+            ]
+        )
+        captioner._caption_with_anthropic = call
+
+        with patch("asyncio.sleep", new=AsyncMock()):
+            result = captioner.caption_image(np.zeros((16, 16, 3), dtype=np.uint8))
+
+        assert result.caption == "A slide."
+
+
+class TestBatchCaptioning:
+    """Test concurrent captioning of many images."""
+
+    @staticmethod
+    def _frames(count):
+        """Create distinct frames so the cache does not merge them."""
+        return [np.full((16, 16, 3), value, dtype=np.uint8) for value in range(count)]
+
+    def test_concurrency_is_bounded(self, captioner):
+        """Test that no more than max_concurrent requests run at once."""
+        active = 0
+        peak = 0
+
+        async def fake_call(image_base64):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+            return {"caption": image_base64[-8:], "tokens": 1, "cost": 0.0}
+
+        captioner._caption_with_anthropic = fake_call
+
+        results = captioner.caption_images(self._frames(10))
+
+        assert len(results) == 10
+        assert peak == captioner.max_concurrent
+
+    def test_batch_preserves_order_and_reports_errors(self, captioner):
+        """Test that results line up with inputs and failures become results."""
+        frames = self._frames(3)
+
+        async def fake_call(image_base64):
+            if image_base64 == failing:
+                raise ValueError("bad image")
+            return {"caption": "ok", "tokens": 1, "cost": 0.0}
+
+        failing = captioner._encode_image(frames[1])[1]
+        captioner._caption_with_anthropic = fake_call
+
+        results = captioner.caption_images(frames)
+
+        assert [r.caption for r in results] == [
+            "ok",
+            "Error: Failed to caption image: bad image",
+            "ok",
+        ]
+
+    def test_stream_yields_every_index(self, captioner):
+        """Test that the stream yields one result per image."""
+        captioner._caption_with_anthropic = AsyncMock(
+            return_value={"caption": "ok", "tokens": 1, "cost": 0.0}
+        )
+
+        async def collect():
+            return [
+                index
+                async for index, _ in captioner.caption_images_stream(self._frames(5))
+            ]
+
+        assert sorted(asyncio.run(collect())) == [0, 1, 2, 3, 4]
+
+    def test_gpu_encoding_is_done_in_bounded_slices(self, captioner):
+        """Test that frames are GPU-encoded max_concurrent at a time."""
+        captioner._caption_with_anthropic = AsyncMock(
+            return_value={"caption": "ok", "tokens": 1, "cost": 0.0}
+        )
+        slice_sizes = []
+
+        def fake_encode(images):
+            slice_sizes.append(len(images))
+            return {i: captioner._encode_image(image) for i, image in enumerate(images)}
+
+        captioner._encode_images_gpu = fake_encode
+        with patch(
+            "video_lens.analysis.api_image_captioner._gpu_jpeg_encoder",
+            return_value=object(),
+        ):
+            results = captioner.caption_images(self._frames(5))
+
+        assert [r.caption for r in results] == ["ok"] * 5
+        assert slice_sizes == [2, 2, 1]
+
+
+class TestSceneCaptioning:
+    """Test captioning one representative frame per scene."""
+
+    def test_one_request_per_scene(self, captioner, api_call):
+        """Test that only the best frame of each scene is captioned."""
+        scenes = [
+            [np.full((16, 16, 3), value, dtype=np.uint8) for value in (0, 10, 20)],
+            [np.full((16, 16, 3), value, dtype=np.uint8) for value in (30, 40)],
+        ]
+
+        with patch.object(
+            captioner, "_encode_image", wraps=captioner._encode_image
+        ) as encode:
+            results = captioner.caption_scenes(scenes, [[0.2, 0.9, 0.5], [0.7, 0.1]])
+
+        assert api_call.await_count == 2
+        assert [call.args[0][0, 0, 0] for call in encode.call_args_list] == [10, 30]
+        assert [len(scene) for scene in results] == [3, 2]
+        assert results[0][1].confidence == 1.0
+        assert results[0][0].confidence == pytest.approx(0.85)
+        assert results[0][0].caption == "A slide."
+        assert results[0][0].cost_estimate == 0.0
+
+    def test_middle_frame_without_scores(self, captioner, api_call):
+        """Test that the middle frame is used when no scores are given."""
+        scene = [np.full((16, 16, 3), value, dtype=np.uint8) for value in (0, 10, 20)]
+
+        results = captioner.caption_scenes([scene, []])
+
+        assert api_call.await_count == 1
+        assert results[0][1].confidence == 1.0
+        assert results[1] == []
+
+    def test_mismatched_quality_scores_are_rejected(self, captioner, api_call):
+        """Test that scores must line up with the frames of every scene."""
+        scenes = [
+            [np.zeros((16, 16, 3), dtype=np.uint8)] * 2,
+            [np.zeros((16, 16, 3), dtype=np.uint8)] * 3,
+        ]
+
+        with pytest.raises(ValueError, match="Scene 1 has 3 frames but 2"):
+            captioner.caption_scenes(scenes, [[0.1, 0.2], [0.3, 0.4]])
+        with pytest.raises(ValueError, match="quality_scores has 1 scenes"):
+            captioner.caption_scenes(scenes, [[0.1, 0.2]])
+        api_call.assert_not_awaited()
+
+
+class TestAsyncInterface:
+    """Test the async-primary API and its synchronous wrappers."""
+
+    def test_async_methods_inside_running_loop(self, captioner, api_call):
+        """Test that async callers can await the captioner directly."""
+        frame = np.zeros((16, 16, 3), dtype=np.uint8)
+
+        async def caption():
+            single = await captioner.acaption_image(frame)
+            batch = await captioner.acaption_images([frame, frame])
+            return single, batch
+
+        single, batch = asyncio.run(caption())
+
+        assert single.caption == "A slide."
+        assert [r.caption for r in batch] == ["A slide.", "A slide."]
+        assert api_call.await_count == 1
+
+    def test_sync_wrapper_refuses_running_loop(self, captioner, api_call):
+        """Test that the sync wrappers point async callers at the async API."""
+        frame = np.zeros((16, 16, 3), dtype=np.uint8)
+
+        async def caption():
+            return captioner.caption_image(frame)
+
+        with pytest.raises(RuntimeError, match="await acaption_image"):
+            asyncio.run(caption())
+        api_call.assert_not_awaited()
+
+
+class TestAPICaptionResult:
+    """Test the caption result container."""
+
+    def test_defaults_and_serialization(self):
+        """Test default values and conversion to a dictionary."""
+        result = APICaptionResult(
+            caption="A slide.",
+            processing_time=0.5,
+            provider="anthropic",
+            model="claude-haiku-4-5",
+        )
+
+        assert dataclasses.asdict(result) == {
+            "caption": "A slide.",
+            "confidence": 1.0,
+            "processing_time": 0.5,
+            "provider": "anthropic",
+            "model": "claude-haiku-4-5",
+            "tokens_used": None,
+            "cost_estimate": None,
+        }
+        assert not hasattr(result, "__dict__")
@@ -0,0 +1,140 @@
+"""Tests for HTML report rendering."""
+
+import pytest
+
+from video_lens.reports.html_renderer import HTMLRenderer
+
+
+@pytest.fixture
+def renderer():
+    """Create an HTML renderer."""
+    return HTMLRenderer()
+
+
+@pytest.fixture
+def sample_report():
+    """Create a report with one frame, one segment and a few scenes."""
+    return {
+        "video": {
+            "file_path": "/videos/lecture.mp4",
+            "duration": 12.5,
+            "width": 640,
+            "height": 480,
+            "fps": 30.0,
+        },
+        "scenes": [
+            {"scene_number": i + 1, "start_time": i, "end_time": i + 1, "duration": 1}
+            for i in range(7)
+        ],
+        "frames": [
+            {
+                "frame_number": 1,
+                "timestamp": 0.5,
+                "scene_number": 1,
+                "width": 640,
+                "height": 480,
+                "caption": "A title slide",
+                "caption_model": "anthropic:claude-haiku-4-5",
+                "ocr_text": "Week 1",
+                "detected_objects": ["slide"],
+                "file_path": "frames/frame_0001.jpg",
+            }
+        ],
+        "transcription_segments": [
+            {"start_time": 0.0, "end_time": 1.0, "text": "Welcome everyone"}
+        ],
+        "language": "en",
+        "total_scenes": 7,
+        "total_frames": 1,
+        "has_transcription": True,
+    }
+
+
+class TestRenderReport:
+    """Test rendering of the HTML report."""
+
+    def test_render_contains_sections(self, renderer, sample_report):
+        """Test that the main report sections are rendered."""
+        html = renderer.render_report(sample_report)
+
+        assert html.startswith("<!DOCTYPE html>")
+        assert "/videos/lecture.mp4" in html
+        assert "A title slide" in html
+        assert "Welcome everyone" in html
+        assert "... and 2 more scenes" in html
+
+    def test_render_empty_report(self, renderer):
+        """Test rendering a report with no analysis results."""
+        html = renderer.render_report({})
+
+        assert "No frames analyzed" in html
+
+    def test_user_content_is_escaped(self, renderer, sample_report):
+        """Test that captions, OCR, transcripts and paths cannot inject HTML."""
+        frame = sample_report["frames"][0]
+        frame["caption"] = "<script>alert('caption')</script>"
+        frame["ocr_text"] = "<b>ocr</b>"
+        frame["detected_objects"] = ["<img src=x onerror=alert(1)>"]
+        frame["file_path"] = 'x.jpg" onerror="alert(1)'
+        sample_report["transcription_segments"][0]["text"] = "<script>bad()</script>"
+        sample_report["video"]["file_path"] = "<i>video</i>.mp4"
+
+        html = renderer.render_report(sample_report)
+
+        assert "<script>" not in html
+        assert "<b>ocr</b>" not in html
+        assert "<img src=x" not in html
+        assert '" onerror="' not in html
+        assert "<i>video</i>" not in html
+        assert "&lt;script&gt;alert(&#39;caption&#39;)&lt;/script&gt;" in html
+        assert 'src="x.jpg&#34; onerror=&#34;alert(1)"' in html
+
+    def test_iter_render_matches_render_report(self, renderer, sample_report):
+        """Test that the chunked renderer produces the same document."""
+        chunks = list(renderer.iter_render(sample_report))
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == renderer.render_report(sample_report)
+
+    def test_template_is_compiled_once(self):
+        """Test that renderers share one compiled template."""
+        assert HTMLRenderer()._template is HTMLRenderer()._template
+
+
+class TestSaveHtml:
+    """Test writing HTML reports to disk."""
+
+    def test_save_rendered_string(self, renderer, sample_report, temp_dir):
+        """Test saving an already-rendered document."""
+        output_path = temp_dir / "nested" / "report.html"
+
+        renderer.save_html(renderer.render_report(sample_report), output_path)
+
+        assert output_path.read_text(encoding="utf-8") == renderer.render_report(
+            sample_report
+        )
+
+    def test_save_streams_chunks(self, renderer, sample_report, temp_dir):
+        """Test streaming chunks from iter_render straight to disk."""
+        output_path = temp_dir / "report.html"
+
+        renderer.save_html(renderer.iter_render(sample_report), output_path)
+
+        assert output_path.read_text(encoding="utf-8") == renderer.render_report(
+            sample_report
+        )
+
+    def test_failed_render_keeps_existing_report(self, renderer, temp_dir):
+        """Test that an error mid-render leaves no partial file in place."""
+        output_path = temp_dir / "report.html"
+        output_path.write_text("previous report", encoding="utf-8")
+
+        def failing_chunks():
+            yield "<html>"
+            raise ValueError("template error")
+
+        with pytest.raises(ValueError, match="template error"):
+            renderer.save_html(failing_chunks(), output_path)
+
+        assert output_path.read_text(encoding="utf-8") == "previous report"
+        assert list(temp_dir.iterdir()) == [output_path]
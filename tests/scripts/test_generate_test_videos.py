@@ -0,0 +1,279 @@
+"""Tests for the test video generator's helpers (no ffmpeg required)."""
+
+import argparse
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+_SCRIPT = Path(__file__).parents[2] / "scripts" / "generate_test_videos.py"
+_spec = importlib.util.spec_from_file_location("generate_test_videos", _SCRIPT)
+assert _spec is not None and _spec.loader is not None
+gtv = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = gtv
+_spec.loader.exec_module(gtv)
+
+
+@pytest.fixture
+def cpu_limits(monkeypatch, temp_dir):
+    """Control the affinity mask, Slurm allocation and cgroup quota."""
+    cpu_max = temp_dir / "cpu.max"
+    monkeypatch.setattr(gtv, "_CGROUP_CPU_MAX", cpu_max)
+    monkeypatch.delenv("SLURM_CPUS_ON_NODE", raising=False)
+
+    def set_limits(affinity=16, slurm=None, cgroup=None):
+        monkeypatch.setattr(
+            os, "sched_getaffinity", lambda _pid: set(range(affinity)), raising=False
+        )
+        if slurm is not None:
+            monkeypatch.setenv("SLURM_CPUS_ON_NODE", slurm)
+        if cgroup is not None:
+            cpu_max.write_text(cgroup)
+
+    return set_limits
+
+
+class TestCpuBudget:
+    """Test counting the CPUs the generator may use."""
+
+    def test_affinity_mask_without_other_limits(self, cpu_limits):
+        """Test that the affinity mask is used when nothing else applies."""
+        cpu_limits(affinity=12)
+
+        assert gtv._cpu_budget() == 12
+
+    @pytest.mark.usefixtures("cpu_limits")
+    def test_falls_back_to_cpu_count_without_affinity(self, monkeypatch):
+        """Test platforms without sched_getaffinity."""
+        monkeypatch.delattr(os, "sched_getaffinity", raising=False)
+        monkeypatch.setattr(os, "cpu_count", lambda: 6)
+
+        assert gtv._cpu_budget() == 6
+
+    def test_slurm_allocation_caps_budget(self, cpu_limits):
+        """Test that a smaller Slurm allocation wins."""
+        cpu_limits(affinity=16, slurm="4")
+
+        assert gtv._cpu_budget() == 4
+
+    @pytest.mark.parametrize("slurm", ["0", "", "four"])
+    def test_invalid_slurm_value_is_ignored(self, cpu_limits, slurm):
+        """Test that unusable Slurm values leave the budget alone."""
+        cpu_limits(affinity=8, slurm=slurm)
+
+        assert gtv._cpu_budget() == 8
+
+    @pytest.mark.parametrize(
+        ("cgroup", "expected"),
+        [
+            ("200000 100000\n", 2),
+            ("150000 100000\n", 2),  # fractional quotas round up
+            ("50000 100000\n", 1),
+            ("max 100000\n", 16),
+            ("garbage\n", 16),
+            ("100000 0\n", 16),
+        ],
+    )
+    def test_cgroup_quota(self, cpu_limits, cgroup, expected):
+        """Test that the cgroup v2 CPU quota is converted to whole CPUs."""
+        cpu_limits(affinity=16, cgroup=cgroup)
+
+        assert gtv._cpu_budget() == expected
+
+    def test_smallest_limit_wins(self, cpu_limits):
+        """Test that the tightest of all limits is used."""
+        cpu_limits(affinity=8, slurm="6", cgroup="300000 100000")
+
+        assert gtv._cpu_budget() == 3
+
+
+class TestConcurrency:
+    """Test resolving --jobs and --ffmpeg-threads."""
+
+    def test_defaults_split_cpu_budget(self, cpu_limits):
+        """Test that half the CPUs encode, sharing the budget evenly."""
+        cpu_limits(affinity=16)
+
+        assert gtv._concurrency(gtv.parse_args([])) == (8, 2)
+
+    def test_jobs_flag_sets_thread_split(self, cpu_limits):
+        """Test that threads per process follow an explicit job count."""
+        cpu_limits(affinity=16)
+
+        assert gtv._concurrency(gtv.parse_args(["--jobs", "4"])) == (4, 4)
+
+    def test_both_flags(self, cpu_limits):
+        """Test that explicit values are used as given."""
+        cpu_limits(affinity=16)
+        args = gtv.parse_args(["-j", "3", "--ffmpeg-threads", "5"])
+
+        assert gtv._concurrency(args) == (3, 5)
+
+    def test_single_cpu(self, cpu_limits):
+        """Test that a one-CPU budget still runs one single-threaded encode."""
+        cpu_limits(affinity=1)
+
+        assert gtv._concurrency(gtv.parse_args([])) == (1, 1)
+
+
+class TestParseArgs:
+    """Test command-line and environment option precedence."""
+
+    @pytest.fixture(autouse=True)
+    def clean_env(self, monkeypatch):
+        """Start each test without the generator's environment overrides."""
+        monkeypatch.delenv("DEEPBRIEF_JOBS", raising=False)
+        monkeypatch.delenv("DEEPBRIEF_FFMPEG_THREADS", raising=False)
+
+    def test_defaults(self):
+        """Test that nothing is overridden by default."""
+        args = gtv.parse_args([])
+
+        assert args.jobs is None
+        assert args.ffmpeg_threads is None
+        assert not args.force
+
+    def test_environment_is_used_without_flags(self, monkeypatch):
+        """Test that environment variables fill in missing flags."""
+        monkeypatch.setenv("DEEPBRIEF_JOBS", "3")
+        monkeypatch.setenv("DEEPBRIEF_FFMPEG_THREADS", "2")
+
+        args = gtv.parse_args([])
+
+        assert (args.jobs, args.ffmpeg_threads) == (3, 2)
+
+    def test_flags_override_environment(self, monkeypatch):
+        """Test that command-line flags win over environment variables."""
+        monkeypatch.setenv("DEEPBRIEF_JOBS", "3")
+        monkeypatch.setenv("DEEPBRIEF_FFMPEG_THREADS", "2")
+
+        args = gtv.parse_args(["--jobs", "5", "--ffmpeg-threads", "7"])
+
+        assert (args.jobs, args.ffmpeg_threads) == (5, 7)
+
+    def test_invalid_environment_value_is_rejected(self, monkeypatch, capsys):
+        """Test that a bad environment value names the variable."""
+        monkeypatch.setenv("DEEPBRIEF_JOBS", "0")
+
+        with pytest.raises(SystemExit):
+            gtv.parse_args([])
+
+        assert "DEEPBRIEF_JOBS" in capsys.readouterr().err
+
+    @pytest.mark.parametrize("value", ["0", "65", "two"])
+    def test_ffmpeg_threads_bounds(self, value):
+        """Test that thread counts outside 1-64 are rejected."""
+        with pytest.raises(argparse.ArgumentTypeError):
+            gtv._ffmpeg_threads_arg(value)
+
+
+class TestThreadCap:
+    """Test that every encode is capped to its share of the CPU budget."""
+
+    def test_build_cmd_caps_threads_after_inputs(self, temp_dir):
+        """Test that -threads is an output option on a libx264 encode."""
+        spec = gtv.TEST_VIDEOS[0]
+        output_file = temp_dir / "minimal_test.mp4"
+
+        cmd = gtv._build_cmd(spec, output_file, "mp4", 3)
+
+        assert cmd[-3:] == ["-threads", "3", str(output_file)]
+        assert cmd.index("-threads") > max(
+            i for i, arg in enumerate(cmd) if arg == "-i"
+        )
+
+    def test_realistic_cmd_caps_every_output(self, temp_dir):
+        """Test that each realistic sample's output gets its own thread cap."""
+        samples = [
+            {"name": "first", "duration": 4},
+            {"name": "second", "duration": 6},
+        ]
+        audio_inputs = [("-i", "a.wav"), ("-i", "b.wav")]
+
+        cmd = gtv._realistic_cmd(samples, audio_inputs, temp_dir, 2, "libx264")
+
+        for sample in samples:
+            output = cmd.index(str(temp_dir / f"{sample['name']}.mp4"))
+            assert cmd[output - 2 : output] == ["-threads", "2"]
+
+
+class TestCommandBuilding:
+    """Test building ffmpeg command lines."""
+
+    def test_build_cmd_uses_common_prefix(self, temp_dir):
+        """Test that every command starts with the shared quiet prefix."""
+        cmd = gtv._build_cmd(gtv.TEST_VIDEOS[0], temp_dir / "out.mp4", "mp4", 1)
+
+        assert tuple(cmd[: len(gtv._FFMPEG_COMMON)]) == gtv._FFMPEG_COMMON
+        assert "libx264" in cmd
+
+    def test_build_cmd_without_audio(self, temp_dir):
+        """Test that silent specs get -an and no sine input."""
+        spec = next(s for s in gtv.TEST_VIDEOS if s.audio_freq is None)
+
+        cmd = gtv._build_cmd(spec, temp_dir / "out.mp4", "mp4", 1)
+
+        assert "-an" in cmd
+        assert not any(arg.startswith("sine=") for arg in cmd)
+
+    def test_build_cmd_uses_hardware_only_for_large_mp4(self, temp_dir):
+        """Test that small fixtures and other containers stay on software."""
+        small = gtv.TEST_VIDEOS[0]
+        large = next(s for s in gtv.TEST_VIDEOS if s.is_dev_sample)
+
+        small_cmd = gtv._build_cmd(small, temp_dir / "a.mp4", "mp4", 1, "h264_nvenc")
+        large_cmd = gtv._build_cmd(large, temp_dir / "b.mp4", "mp4", 1, "h264_nvenc")
+        webm_cmd = gtv._build_cmd(large, temp_dir / "c.webm", "webm", 1, "h264_nvenc")
+
+        assert "h264_nvenc" not in small_cmd
+        assert "h264_nvenc" in large_cmd
+        assert "h264_nvenc" not in webm_cmd
+        assert "libvpx-vp9" in webm_cmd
+
+    def test_realistic_cmd_maps_each_sample(self, temp_dir):
+        """Test that every sample gets its own filter branch and output."""
+        samples = [
+            {"name": "first", "duration": 4},
+            {"name": "second", "duration": 6},
+        ]
+        audio_inputs = [("-i", "a.wav"), ("-i", "b.wav")]
+
+        cmd = gtv._realistic_cmd(samples, audio_inputs, temp_dir, 2, "libx264")
+
+        graph = cmd[cmd.index("-filter_complex") + 1]
+        assert graph.count(";") == 1
+        assert "[0:v]" in graph and "[2:v]" in graph
+        assert cmd[cmd.index("[v1]") + 2] == "3:a"
+        assert str(temp_dir / "first.mp4") in cmd
+        assert cmd[-1] == str(temp_dir / "second.mp4")
+
+
+class TestUpToDate:
+    """Test skipping outputs whose spec has not changed."""
+
+    def test_requires_output_and_matching_digest(self, temp_dir):
+        """Test the output-plus-sidecar freshness check."""
+        output_file = temp_dir / "video.mp4"
+        digest = gtv._spec_digest("spec", 1)
+
+        assert not gtv._is_up_to_date(output_file, digest)
+
+        output_file.write_bytes(b"video")
+        assert not gtv._is_up_to_date(output_file, digest)
+
+        gtv._digest_file(output_file).write_text(digest)
+        assert gtv._is_up_to_date(output_file, digest)
+        assert not gtv._is_up_to_date(output_file, gtv._spec_digest("spec", 2))
+
+    def test_invalidate_removes_sidecar(self, temp_dir):
+        """Test that invalidating forces the next run to regenerate."""
+        output_file = temp_dir / "video.mp4"
+        output_file.write_bytes(b"video")
+        digest = gtv._spec_digest("spec")
+        gtv._digest_file(output_file).write_text(digest)
+
+        gtv._invalidate_digest(output_file)
+
+        assert not gtv._is_up_to_date(output_file, digest)
@@ -0,0 +1,275 @@
+"""Tests for the CLI progress display."""
+
+import itertools
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from video_lens.utils.progress_display import (
+    CLIProgressTracker,
+    OperationProgress,
+    create_progress_callback,
+)
+
+
+@pytest.fixture
+def tracker():
+    """CLI tracker with one started operation and a mocked Rich display."""
+    tracker = CLIProgressTracker()
+    tracker.start_workflow("Test workflow", [("op", "Operation", 1.0)])
+    tracker.progress.stop()
+    tracker.progress = MagicMock()
+    tracker.progress.add_task.return_value = 0
+    tracker._min_interval = 0.0
+    tracker.start_operation("op")
+    return tracker
+
+
+class TestOperationProgress:
+    """Test single-operation progress tracking."""
+
+    def test_update_is_clamped_to_total(self):
+        """Test that progress cannot exceed the operation's weight."""
+        op = OperationProgress("Operation", total_steps=0.5)
+
+        op.update(1.5)
+
+        assert op.current_step == 0.5
+        assert op.get_percentage() == 100
+
+    def test_update_is_scaled_by_weight(self):
+        """Test that progress is stored in units of the operation's weight."""
+        op = OperationProgress("Operation", total_steps=0.2)
+
+        assert op.update(0.5) == pytest.approx(0.1)
+        assert op.get_percentage() == 50
+        assert op.percent == 50
+
+    def test_update_never_moves_backwards(self):
+        """Test that repeated or lower values are ignored."""
+        op = OperationProgress("Operation")
+        op.update(0.6)
+
+        assert op.update(0.6) == 0.0
+        assert op.update(0.3) == 0.0
+        assert op.current_step == 0.6
+
+    @pytest.mark.parametrize("total", [0.0, -1.0])
+    def test_zero_total_reports_zero_percent(self, total):
+        """Test that an operation without a positive total does not divide by zero."""
+        op = OperationProgress("Operation", total_steps=total)
+
+        op.update(0.5)
+
+        assert op.get_percentage() == 0
+
+    @pytest.mark.parametrize("weight", [0.09, 0.3, 0.47, 1.0, 2.5])
+    def test_complete_operation_reports_full_percentage(self, weight):
+        """Test that a finished operation is 100% whatever its weight."""
+        op = OperationProgress("Operation", total_steps=weight)
+
+        op.update(1.0)
+
+        assert op.get_percentage() == 100
+
+
+class TestCLIProgressTracker:
+    """Test the Rich-backed workflow tracker."""
+
+    def test_non_positive_weight_falls_back_to_one(self):
+        """Test that invalid operation weights are replaced with 1.0."""
+        tracker = CLIProgressTracker()
+        tracker.start_workflow("Test workflow", [("a", "A", 0.0), ("b", "B", -2.0)])
+        tracker.progress.stop()
+
+        assert tracker.cli_operations["a"].total_steps == 1.0
+        assert tracker.cli_operations["b"].total_steps == 1.0
+
+    def test_columns_are_shared_between_workflows(self):
+        """Test that progress bar columns are only built once."""
+        first = CLIProgressTracker()
+        first.start_workflow("First", [("a", "A", 1.0)])
+        first.progress.stop()
+        second = CLIProgressTracker()
+        second.start_workflow("Second", [("a", "A", 1.0)])
+        second.progress.stop()
+
+        assert first.progress.columns[:3] == second.progress.columns[:3]
+        assert first.progress.columns[3] is not second.progress.columns[3]
+
+    def test_workflow_progress_is_weighted(self):
+        """Test that overall progress weights each operation's share."""
+        tracker = CLIProgressTracker()
+        tracker.start_workflow("Test workflow", [("a", "A", 1.0), ("b", "B", 3.0)])
+        tracker.progress.stop()
+        tracker.progress = MagicMock()
+
+        tracker.update_progress("a", 0.5)
+        assert tracker.get_workflow_progress() == pytest.approx(0.125)
+
+        tracker.complete_operation("a")
+        tracker.update_progress("b", 0.5)
+        assert tracker.get_workflow_progress() == pytest.approx(0.625)
+
+        tracker.complete_operation("b")
+        assert tracker.get_workflow_progress() == pytest.approx(1.0)
+
+    def test_repeated_updates_are_throttled(self, tracker):
+        """Test that Rich is only updated when the bar would change."""
+        for i in range(1000):
+            tracker.update_progress("op", i / 1000)
+
+        assert tracker.progress.update.call_count == 100
+
+    def test_redraws_are_batched(self, tracker):
+        """Test that updates inside the render interval share one redraw."""
+        tracker._min_interval = 0.05
+        tracker.progress.refresh.reset_mock()
+
+        tracker.update_progress("op", 0.1)
+        tracker.update_progress("op", 0.2)
+        tracker.complete_operation("op")
+
+        completed = [
+            c.kwargs["completed"] for c in tracker.progress.update.call_args_list
+        ]
+        assert completed == [10, 20, 100]
+        assert tracker.progress.refresh.call_count == 0
+
+        tracker._flush_timer.join()
+        tracker.progress.refresh.assert_called_once()
+        assert tracker._flush_timer is None
+
+    def test_flush_redraws_immediately(self, tracker):
+        """Test that flush refreshes the display without waiting."""
+        tracker.progress.refresh.reset_mock()
+
+        tracker.flush()
+
+        tracker.progress.refresh.assert_called_once()
+
+    def test_unchanged_description_is_not_resent(self, tracker):
+        """Test that progress within one step only updates the completion."""
+        tracker.update_progress("op", 0.1, current_step="Loading")
+        tracker.update_progress("op", 0.2, current_step="Loading")
+
+        first, second = tracker.progress.update.call_args_list
+        assert first.kwargs["description"] == "Operation • Loading"
+        assert "description" not in second.kwargs
+
+    def test_regressive_updates_are_ignored(self, tracker):
+        """Test that a lower progress value does not move the bar back."""
+        tracker.update_progress("op", 0.5)
+        tracker.update_progress("op", 0.2)
+
+        tracker.progress.update.assert_called_once()
+        assert tracker.progress.update.call_args.kwargs["completed"] == 50
+
+    def test_complete_operation_skips_finished_bar(self, tracker):
+        """Test that completing an operation already at 100% does not update Rich."""
+        tracker.update_progress("op", 1.0)
+        tracker.progress.update.reset_mock()
+
+        tracker.complete_operation("op")
+
+        tracker.progress.update.assert_not_called()
+
+    def test_long_descriptions_are_truncated(self, tracker):
+        """Test that long step descriptions are cut to the display limit."""
+        tracker.update_progress("op", 0.5, current_step="x" * 200)
+
+        desc = tracker.progress.update.call_args.kwargs["description"]
+        assert len(desc) == 60
+        assert desc.startswith("Operation • x")
+        assert desc.endswith("…")
+
+    def test_step_change_forces_update(self, tracker):
+        """Test that a new step description is sent even at the same percentage."""
+        tracker.update_progress("op", 0.5, current_step="Loading")
+        tracker.update_progress("op", 0.5, current_step="Loading")
+        tracker.update_progress("op", 0.5, current_step="Decoding")
+
+        assert tracker.progress.update.call_count == 2
+        assert (
+            tracker.progress.update.call_args.kwargs["description"]
+            == "Operation • Decoding"
+        )
+
+    def test_operations_beyond_limit_share_overflow_task(self):
+        """Test that hidden operations are summarised in one overflow task."""
+        tracker = CLIProgressTracker()
+        operations = [(f"op{i}", f"Operation {i}", 1.0) for i in range(4)]
+        tracker.start_workflow("Test workflow", operations)
+        tracker.progress.stop()
+        tracker.progress = MagicMock()
+        tracker.progress.add_task.side_effect = itertools.count()
+        tracker._max_visible = 2
+        tracker._min_interval = 0.0
+
+        for op_id, _, _ in operations:
+            tracker.start_operation(op_id)
+        tracker.update_progress("op2", 0.5)
+        tracker.complete_operation("op3")
+
+        task_ids = [op.task_id for op in tracker.cli_operations.values()]
+        assert task_ids == [0, 1, None, None]
+        assert tracker.progress.add_task.call_count == 3
+        tracker.progress.update.assert_called_with(
+            2, total=200, completed=150, description="+2 more operations"
+        )
+
+
+class TestCreateProgressCallback:
+    """Test the coalescing progress callback."""
+
+    def test_bursts_are_coalesced(self, tracker):
+        """Test that a burst of calls reaches the tracker as its latest value."""
+        tracker.update_progress = MagicMock()
+        callback = create_progress_callback(tracker, "op")
+
+        for i in range(1000):
+            callback(i / 1000)
+        tracker.complete_workflow()
+
+        assert tracker.update_progress.call_count <= 3
+        tracker.update_progress.assert_called_with(operation_id="op", progress=0.999)
+
+    def test_no_workflow_gives_noop_callback(self):
+        """Test that no flush thread is created when nothing is displayed."""
+        tracker = CLIProgressTracker()
+
+        callback = create_progress_callback(tracker, "op")
+        callback(0.5)
+
+        assert tracker._coalesced_callbacks == []
+        assert not hasattr(callback, "_thread")
+
+    def test_callback_is_stopped_with_workflow(self, tracker):
+        """Test that the workflow's end stops the flush thread."""
+        callback = create_progress_callback(tracker, "op")
+        callback(0.5)
+
+        tracker.fail_workflow("error")
+
+        assert callback._stopped.is_set()
+        assert not callback._thread.is_alive()
+        assert tracker._coalesced_callbacks == []
+
+    def test_concurrent_updates_keep_totals_consistent(self, tracker):
+        """Test that updates from several threads do not lose progress."""
+        steps = [i / 1000 for i in range(1, 1001)]
+
+        def run(values):
+            for value in values:
+                tracker.update_progress("op", value)
+
+        threads = [threading.Thread(target=run, args=(steps[i::4],)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        tracker.complete_operation("op")
+        for thread in threads:
+            thread.join()
+
+        assert tracker.get_workflow_progress() == pytest.approx(1.0)
+        assert tracker.cli_operations["op"].current_step == 1.0